@@ -3,6 +3,59 @@
 Представлены версии с выделением памяти и in-place реализация.
 """
 
+import heapq
+import operator
+from itertools import islice
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba необязателен: без него heap_sort_bulk сортирует строки по очереди
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _heapsort_core(row):
+        """Сортировка одной строки на месте с помощью максимальной кучи."""
+        size = row.shape[0]
+        
+        for start in range(size // 2 - 1, -1, -1):
+            current = start
+            while True:
+                child = 2 * current + 1
+                if child >= size:
+                    break
+                if child + 1 < size and row[child + 1] > row[child]:
+                    child += 1
+                if row[child] <= row[current]:
+                    break
+                row[current], row[child] = row[child], row[current]
+                current = child
+        
+        for boundary in range(size - 1, 0, -1):
+            row[0], row[boundary] = row[boundary], row[0]
+            current = 0
+            while True:
+                child = 2 * current + 1
+                if child >= boundary:
+                    break
+                if child + 1 < boundary and row[child + 1] > row[child]:
+                    child += 1
+                if row[child] <= row[current]:
+                    break
+                row[current], row[child] = row[child], row[current]
+                current = child
+    
+    @njit(parallel=True, cache=True)
+    def _heapsort_rows(matrix):
+        """Параллельная сортировка независимых строк матрицы."""
+        for i in prange(matrix.shape[0]):
+            _heapsort_core(matrix[i])
+else:
+    _heapsort_rows = None
+
+
 def heap_sort_extra(array):
     """
     Сортировка с использованием дополнительной памяти.
@@ -14,76 +67,176 @@ def heap_sort_extra(array):
         Отсортированный массив (по возрастанию)
         
     Сложность: O(n log n)
+    Память: O(n) - копия массива ссылок, которая сокращается по мере
+    заполнения результата; сами элементы не копируются.
+    Для сортировки без дополнительной памяти см. heap_sort_inplace.
+    """
+    # Построение минимальной кучи за O(n) (алгоритм Флойда в heapq)
+    heap_data = list(array)
+    heapq.heapify(heap_data)
+    
+    # Извлечение элементов: просеивание выполняется внутри heapq на C
+    return [heapq.heappop(heap_data) for _ in range(len(heap_data))]
+
+
+def heap_sort_adaptive(array):
     """
-    # Создаем кучу как список
-    heap_data = []
+    Сортировка с учетом частичной упорядоченности входных данных.
     
-    # Построение минимальной кучи
-    for element in array:
-        # Добавляем элемент в конец
-        heap_data.append(element)
+    За один проход подсчитывается число нарушений порядка между
+    соседними элементами. Если данные почти отсортированы (в прямом
+    или обратном порядке), используется Timsort (sorted), который
+    находит упорядоченные серии за O(n); иначе - сортировка кучей,
+    которая не умеет использовать готовый порядок.
+    
+    Параметры:
+        array: Исходный массив данных
         
-        # Восстанавливаем свойства кучи
-        current_index = len(heap_data) - 1
+    Возвращает:
+        Отсортированный массив (по возрастанию)
         
-        # Просеивание вверх
-        while current_index > 0:
-            parent_index = (current_index - 1) // 2
-            
-            # Если порядок правильный, останавливаемся
-            if heap_data[current_index] >= heap_data[parent_index]:
-                break
-                
-            # Меняем местами с родителем
-            heap_data[current_index], heap_data[parent_index] = \
-                heap_data[parent_index], heap_data[current_index]
-                
-            current_index = parent_index
-    
-    # Извлечение элементов из кучи
-    sorted_result = []
-    
-    while heap_data:
-        # Получаем минимальный элемент
-        min_element = heap_data[0]
-        
-        # Заменяем корень последним элементом
-        if len(heap_data) > 1:
-            heap_data[0] = heap_data.pop()
-            
-            # Восстанавливаем свойства кучи
-            current_index = 0
-            heap_size = len(heap_data)
-            
-            while True:
-                left_child = 2 * current_index + 1
-                right_child = 2 * current_index + 2
-                min_index = current_index
-                
-                # Поиск минимального среди текущего узла и его потомков
-                if (left_child < heap_size and 
-                    heap_data[left_child] < heap_data[min_index]):
-                    min_index = left_child
-                    
-                if (right_child < heap_size and 
-                    heap_data[right_child] < heap_data[min_index]):
-                    min_index = right_child
-                
-                # Если порядок правильный, останавливаемся
-                if min_index == current_index:
-                    break
-                    
-                # Меняем местами с минимальным потомком
-                heap_data[current_index], heap_data[min_index] = \
-                    heap_data[min_index], heap_data[current_index]
-                    
-                current_index = min_index
-        else:
-            heap_data.pop()
+    Сложность: O(n) для почти упорядоченных данных, иначе O(n log n)
+    """
+    values = list(array)
+    size = len(values)
+    
+    if size < 2:
+        return values
+    
+    descents = sum(map(operator.gt, values, islice(values, 1, None)))
+    threshold = (size - 1) // 16
+    
+    if descents <= threshold or descents >= size - 1 - threshold:
+        return sorted(values)
+    
+    return heap_sort_extra(values)
+
+
+def heap_sort_top_k(array, k):
+    """
+    Получение k наименьших элементов в порядке возрастания.
+    
+    Параметры:
+        array: Исходный массив данных
+        k: Количество элементов
+        
+    Возвращает:
+        Список из min(k, n) наименьших элементов по возрастанию
+        
+    Сложность: O(n log k)
+    """
+    return heapq.nsmallest(k, array)
+
+
+def heap_sort_int(array, bits=32):
+    """
+    Сортировка неотрицательных целых чисел подсчетом.
+    
+    Если все элементы - int из диапазона [0, 2**bits) и разброс
+    значений невелик, используется сортировка подсчетом за O(n + k)
+    (через numpy.bincount, если numpy установлен и значения меньше
+    2**63). При широком диапазоне используется numpy.sort, а для прочих
+    данных - обычная сортировка кучей.
+    
+    Параметры:
+        array: Исходный массив целых чисел
+        bits: Разрядность допустимых значений
+        
+    Возвращает:
+        Отсортированный массив (по возрастанию)
+        
+    Сложность: O(n + k), где k - разброс значений
+    """
+    values = list(array)
+    
+    if not values:
+        return values
+    
+    # Только int: подклассы (например, bool) сортируются кучей и
+    # возвращаются без преобразования в int
+    if not all(type(value) is int for value in values):
+        return heap_sort_extra(values)
+    
+    low, high = min(values), max(values)
+    if low < 0 or high >= 1 << bits:
+        return heap_sort_extra(values)
+    
+    span = high - low + 1
+    counting = span <= max(4 * len(values), 1 << 16)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    # Значения от 2**63 не помещаются в int64 массива numpy
+    if np is None or high >= 1 << 63:
+        if not counting:
+            return heap_sort_extra(values)
+        
+        # Сортировка подсчетом на чистом Python
+        counts = [0] * span
+        for value in values:
+            counts[value - low] += 1
+        
+        result = []
+        for offset, count in enumerate(counts):
+            if count:
+                result.extend([low + offset] * count)
+        return result
+    
+    data = np.asarray(values, dtype=np.int64)
+    if not counting:
+        return np.sort(data, kind='stable').tolist()
+    
+    counts = np.bincount(data - low, minlength=span)
+    return np.repeat(np.arange(low, high + 1), counts).tolist()
+
+
+def heapify_down_floyd(data, root, boundary):
+    """
+    Просеивание вниз по схеме Флойда (bottom-up).
+    
+    Сначала «дырка» опускается до листа по пути большего потомка
+    без сравнения с просеиваемым элементом, затем элемент поднимается
+    от листа вверх до своей позиции. Требует около n log n сравнений
+    вместо 2n log n у классического просеивания.
+    
+    Параметры:
+        data: Массив данных (максимальная куча)
+        root: Индекс корня поддерева
+        boundary: Граница кучи (включительно)
         
-        sorted_result.append(min_element)
+    Сложность: O(log n)
+    """
+    value = data[root]
+    current = root
+    
+    # Спуск до листа по пути большего потомка. Пока у узла есть оба
+    # потомка, проверка правой границы не нужна
+    last_full_parent = (boundary - 2) // 2
+    while current <= last_full_parent:
+        child = 2 * current + 1
+        if data[child] < data[child + 1]:
+            child += 1
+        data[current] = data[child]
+        current = child
+    
+    # Не более одного уровня с единственным (левым) потомком
+    child = 2 * current + 1
+    if child <= boundary:
+        data[current] = data[child]
+        current = child
     
-    return sorted_result
+    # Подъем элемента от листа до места вставки
+    while current > root:
+        parent = (current - 1) // 2
+        if value <= data[parent]:
+            break
+        data[current] = data[parent]
+        current = parent
+    
+    data[current] = value
 
 
 def heap_sort_inplace(collection):
@@ -109,30 +262,32 @@ def heap_sort_inplace(collection):
             node_index: Индекс корня поддерева
             boundary: Граница кучи
         """
+        value = data[node_index]
         current = node_index
         
-        while True:
+        # Быстрый путь: у узлов до last_full_parent есть оба потомка
+        last_full_parent = (boundary - 2) // 2
+        while current <= last_full_parent:
             # Индекс большего потомка
-            left_child = 2 * current + 1
-            largest_index = current
-            
-            # Проверяем левого потомка
-            if left_child <= boundary and data[left_child] > data[largest_index]:
-                largest_index = left_child
-            
-            # Проверяем правого потомка
-            right_child = left_child + 1
-            if (right_child <= boundary and 
-                data[right_child] > data[largest_index]):
-                largest_index = right_child
+            largest_index = 2 * current + 1
+            if data[largest_index] < data[largest_index + 1]:
+                largest_index += 1
             
             # Если текущий элемент уже на своем месте
-            if largest_index == current:
-                return
+            if data[largest_index] <= value:
+                break
             
-            # Обмен с большим потомком
-            data[current], data[largest_index] = data[largest_index], data[current]
+            # Сдвигаем больший потомок вверх
+            data[current] = data[largest_index]
             current = largest_index
+        else:
+            # Медленный путь: единственный левый потомок на последнем уровне
+            left_child = 2 * current + 1
+            if left_child <= boundary and data[left_child] > value:
+                data[current] = data[left_child]
+                current = left_child
+        
+        data[current] = value
     
     size = len(collection)
     
@@ -150,11 +305,119 @@ def heap_sort_inplace(collection):
         collection[0], collection[boundary] = collection[boundary], collection[0]
         
         # Восстанавливаем свойства кучи в оставшейся части
+        # (новый корень почти всегда опускается до листа)
+        heapify_down_floyd(collection, 0, boundary - 1)
+    
+    return collection
+
+
+def heap_sort_inplace_dary(collection, d=4):
+    """
+    Сортировка на месте с использованием d-арной максимальной кучи.
+    
+    Потомки узла i лежат подряд в позициях d*i+1 ... d*i+d, поэтому
+    выбор наибольшего из них идет по соседним ячейкам памяти, а высота
+    дерева снижается с log2(n) до log_d(n).
+    
+    Параметры:
+        collection: Список для сортировки (изменяется на месте)
+        d: Арность кучи (число потомков у узла), d >= 2
+        
+    Возвращает:
+        Отсортированный список
+        
+    Сложность: O(n log n)
+    Память: O(1)
+    """
+    if d < 2:
+        raise ValueError("Арность кучи должна быть не меньше 2")
+    
+    def heapify_down(data, node_index, boundary):
+        """
+        Просеивание элемента вниз в d-арной куче.
+        
+        Параметры:
+            data: Массив данных
+            node_index: Индекс корня поддерева
+            boundary: Граница кучи (включительно)
+        """
+        value = data[node_index]
+        current = node_index
+        
+        while True:
+            first_child = d * current + 1
+            if first_child > boundary:
+                break
+            
+            # Поиск наибольшего среди d соседних потомков
+            last_child = min(first_child + d - 1, boundary)
+            largest_index = first_child
+            largest_value = data[first_child]
+            for child in range(first_child + 1, last_child + 1):
+                if data[child] > largest_value:
+                    largest_index = child
+                    largest_value = data[child]
+            
+            if largest_value <= value:
+                break
+            
+            # Сдвигаем потомка вверх, элемент записывается один раз в конце
+            data[current] = largest_value
+            current = largest_index
+        
+        data[current] = value
+    
+    size = len(collection)
+    
+    if size <= 1:
+        return collection
+    
+    # Фаза 1: Построение максимальной кучи
+    for i in range((size - 2) // d, -1, -1):
+        heapify_down(collection, i, size - 1)
+    
+    # Фаза 2: Сортировка
+    for boundary in range(size - 1, 0, -1):
+        collection[0], collection[boundary] = collection[boundary], collection[0]
         heapify_down(collection, 0, boundary - 1)
     
     return collection
 
 
+def heap_sort_bulk(matrix):
+    """
+    Сортировка каждой строки двумерного массива кучей.
+    
+    Строки независимы, поэтому при наличии numba строки числовых
+    массивов сортируются параллельно (numba.prange) скомпилированным кодом.
+    
+    Параметры:
+        matrix: numpy.ndarray формы (строки, длина) или список списков;
+            одномерный массив сортируется как одна строка
+        
+    Возвращает:
+        Копия входных данных того же вида с отсортированными строками
+        
+    Сложность: O(r * m log m) для r строк длины m
+    """
+    if hasattr(matrix, 'ndim'):
+        if matrix.ndim not in (1, 2):
+            raise ValueError(
+                f"Ожидался одно- или двумерный массив, получено измерений: {matrix.ndim}")
+        result = matrix.copy()
+        if result.ndim == 1:
+            return heap_sort_inplace(result)
+        if _heapsort_rows is not None and result.dtype.kind in 'iuf':
+            # Массивы строк и объектов Python ядро numba не принимает
+            _heapsort_rows(result)
+        else:
+            for row in result:
+                heap_sort_inplace(row)
+        return result
+    
+    return [heap_sort_inplace(list(row)) for row in matrix]
+
+
 def heap_sort_with_class(sequence):
     """
     Сортировка с использованием класса Heap.
@@ -192,6 +455,7 @@ def heap_sort_with_class(sequence):
 
 # Альтернативные имена функций для обратной совместимости
 heapsort = heap_sort_extra
+heap_sort_strict = heap_sort_extra  # Всегда через кучу, без эвристик
 heapsort_inplace = heap_sort_inplace
 heap_sort_min = heap_sort_with_class
 
@@ -216,6 +480,9 @@ def test_sort_functions():
         result1 = heap_sort_extra(original)
         result2 = heap_sort_inplace(original.copy())
         result3 = heap_sort_with_class(original)
+        result4 = heap_sort_inplace_dary(original.copy())
+        result5 = heap_sort_int(original)
+        result6 = heap_sort_adaptive(original)
         
         # Проверяем корректность
         expected = sorted(original)
@@ -223,6 +490,9 @@ def test_sort_functions():
         assert result1 == expected, f"Ошибка в heap_sort_extra: {original}"
         assert result2 == expected, f"Ошибка в heap_sort_inplace: {original}"
         assert result3 == expected, f"Ошибка в heap_sort_with_class: {original}"
+        assert result4 == expected, f"Ошибка в heap_sort_inplace_dary: {original}"
+        assert result5 == expected, f"Ошибка в heap_sort_int: {original}"
+        assert result6 == expected, f"Ошибка в heap_sort_adaptive: {original}"
         
         print(f"✓ Тест пройден: {original} → {result1}")
 
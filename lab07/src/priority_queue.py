@@ -3,9 +3,10 @@
 Основана на минимальной куче для обеспечения эффективности операций.
 """
 
+from array import array
 from collections import namedtuple
 from typing import Any, Optional
-import heapq as std_heapq  # Для альтернативной реализации
+import heapq as std_heapq
 
 
 class PriorityNode:
@@ -25,15 +26,16 @@ class PriorityNode:
         self.priority_value = priority
     
     def __lt__(self, other: 'PriorityNode') -> bool:
-        """Оператор сравнения для работы с минимальной кучей."""
-        if not isinstance(other, PriorityNode):
-            return NotImplemented
+        """
+        Оператор сравнения для работы с минимальной кучей.
+        
+        Куча однородна, поэтому тип второго операнда не проверяется:
+        сравнение с объектом другого типа приводит к AttributeError.
+        """
         return self.priority_value < other.priority_value
     
     def __le__(self, other: 'PriorityNode') -> bool:
-        """Оператор сравнения 'меньше или равно'."""
-        if not isinstance(other, PriorityNode):
-            return NotImplemented
+        """Оператор сравнения 'меньше или равно' (без проверки типа)."""
         return self.priority_value <= other.priority_value
     
     def __eq__(self, other: Any) -> bool:
@@ -73,20 +75,29 @@ class HeapPriorityQueue:
         Параметры:
             initial_data: Начальные данные в формате [(данные, приоритет), ...]
         """
-        try:
-            from heap import MinHeap
-            self._storage = MinHeap()
-        except ImportError:
-            # Фолбэк на стандартную библиотеку
-            self._storage = []
-            self._use_std_heap = True
-        else:
-            self._use_std_heap = False
+        # Куча кортежей (приоритет, номер, данные) в виде обычного списка;
+        # все операции выполняет модуль heapq на уровне C
+        self._storage = []
+        
+        # Счетчик вставок: сохраняет порядок FIFO при равных приоритетах
+        # и избавляет от сравнения самих элементов
+        self._counter = 0
         
-        # Добавляем начальные данные если они предоставлены
+        # Индекс для быстрой проверки наличия: элемент -> {приоритет: количество}
+        self._index = {}
+        
+        # Добавляем начальные данные если они предоставлены:
+        # куча строится целиком за O(n) вместо n вставок по O(log n)
         if initial_data:
-            for item, priority in initial_data:
-                self.add(item, priority)
+            entries = [(priority, index, item)
+                       for index, (item, priority) in enumerate(initial_data)]
+            self._counter = len(entries)
+            
+            for priority, _, item in entries:
+                self._index_add(item, priority)
+            
+            self._storage = entries
+            std_heapq.heapify(self._storage)
     
     def add(self, item: Any, priority: int) -> None:
         """
@@ -98,12 +109,13 @@ class HeapPriorityQueue:
             
         Сложность: O(log n)
         """
-        node = PriorityNode(item, priority)
+        # Кортежи сравниваются на уровне C без вызова Python-метода __lt__
+        entry = (priority, self._counter, item)
+        self._counter += 1
         
-        if self._use_std_heap:
-            std_heapq.heappush(self._storage, node)
-        else:
-            self._storage.push(node)
+        std_heapq.heappush(self._storage, entry)
+        
+        self._index_add(item, priority)
     
     enqueue = add  # Синоним для совместимости
     
@@ -122,15 +134,45 @@ class HeapPriorityQueue:
         if self.is_empty():
             raise IndexError("Очередь приоритетов пуста")
         
-        if self._use_std_heap:
-            node = std_heapq.heappop(self._storage)
-        else:
-            node = self._storage.pop()
+        entry = std_heapq.heappop(self._storage)
         
-        return node.data
+        self._index_discard(entry[-1], entry[0])
+        return entry[-1]
     
     dequeue = remove  # Синоним для совместимости
     
+    def replace(self, item: Any, priority: int) -> Any:
+        """
+        Извлечение элемента с наивысшим приоритетом и добавление нового.
+        
+        Новый узел ставится на место корня и просеивается вниз за один
+        проход, поэтому сравнения потомков выполняются один раз вместо
+        двух проходов remove() + add().
+        
+        Параметры:
+            item: Новый элемент данных
+            priority: Приоритет нового элемента
+            
+        Возвращает:
+            Данные извлеченного элемента
+            
+        Исключения:
+            IndexError: При попытке извлечения из пустой очереди
+            
+        Сложность: O(log n)
+        """
+        if self.is_empty():
+            raise IndexError("Очередь приоритетов пуста")
+        
+        entry = (priority, self._counter, item)
+        self._counter += 1
+        
+        entry = std_heapq.heapreplace(self._storage, entry)
+        
+        self._index_add(item, priority)
+        self._index_discard(entry[-1], entry[0])
+        return entry[-1]
+    
     def peek(self) -> Any:
         """
         Получение элемента с наивысшим приоритетом без удаления.
@@ -146,12 +188,7 @@ class HeapPriorityQueue:
         if self.is_empty():
             raise IndexError("Очередь приоритетов пуста")
         
-        if self._use_std_heap:
-            node = self._storage[0]
-        else:
-            node = self._storage.top()
-        
-        return node.data
+        return self._storage[0][-1]
     
     def front(self) -> Any:
         """Синоним для peek()."""
@@ -166,10 +203,7 @@ class HeapPriorityQueue:
             
         Сложность: O(1)
         """
-        if self._use_std_heap:
-            return len(self._storage) == 0
-        else:
-            return len(self._storage) == 0
+        return len(self._storage) == 0
     
     def __len__(self) -> int:
         """
@@ -180,36 +214,24 @@ class HeapPriorityQueue:
             
         Сложность: O(1)
         """
-        if self._use_std_heap:
-            return len(self._storage)
-        else:
-            return len(self._storage)
+        return len(self._storage)
     
     def __bool__(self) -> bool:
         """Проверка наличия элементов. O(1)"""
         return not self.is_empty()
     
     def __iter__(self):
-        """Итерация по элементам в порядке приоритета."""
-        # Создаем копию для безопасной итерации
-        temp_queue = HeapPriorityQueue()
-        items = []
-        
-        if self._use_std_heap:
-            temp_storage = self._storage.copy()
-            while temp_storage:
-                node = std_heapq.heappop(temp_storage)
-                items.append(node.data)
-                temp_queue.add(node.data, node.priority_value)
-        else:
-            # Для кастомной реализации нужно клонирование
-            while not self.is_empty():
-                item = self.remove()
-                items.append(item)
-                # Восстановление невозможно без сохранения приоритетов
-                # Для упрощения просто собираем элементы
+        """
+        Ленивая итерация по элементам в порядке приоритета.
         
-        return iter(items)
+        Извлечение идет из копии хранилища, поэтому сама очередь
+        не изменяется. Копия уже упорядочена как куча, так что
+        стоимость: O(n) на копирование и O(log n) на каждый элемент.
+        """
+        temp_storage = self._storage[:]
+        
+        while temp_storage:
+            yield std_heapq.heappop(temp_storage)[-1]
     
     def __str__(self) -> str:
         """Строковое представление очереди."""
@@ -221,10 +243,32 @@ class HeapPriorityQueue:
     
     def clear(self) -> None:
         """Очистка очереди. O(1)"""
-        if self._use_std_heap:
-            self._storage.clear()
+        self._storage.clear()
+        self._index.clear()
+    
+    def _index_add(self, item: Any, priority: int) -> None:
+        """Учет элемента в индексе наличия. O(1)"""
+        try:
+            counts = self._index.setdefault(item, {})
+        except TypeError:
+            # Нехешируемые элементы ищутся перебором в contains()
+            return
+        counts[priority] = counts.get(priority, 0) + 1
+    
+    def _index_discard(self, item: Any, priority: int) -> None:
+        """Удаление одного вхождения элемента из индекса наличия. O(1)"""
+        try:
+            counts = self._index.get(item)
+        except TypeError:
+            return
+        if counts is None:
+            return
+        if counts[priority] > 1:
+            counts[priority] -= 1
         else:
-            self._storage.clear()
+            del counts[priority]
+            if not counts:
+                del self._index[item]
     
     def contains(self, item: Any, priority: Optional[int] = None) -> bool:
         """
@@ -237,18 +281,18 @@ class HeapPriorityQueue:
         Возвращает:
             True если элемент найден, иначе False
             
-        Сложность: O(n)
+        Сложность: O(1) для хешируемых элементов, иначе O(n)
         """
-        if self._use_std_heap:
-            for node in self._storage:
-                if node.data == item:
-                    if priority is None or node.priority_value == priority:
-                        return True
-        else:
-            # Для кастомной реализации нужен доступ к внутреннему хранилищу
-            pass
+        try:
+            counts = self._index.get(item)
+        except TypeError:
+            # Нехешируемый элемент: линейный поиск по хранилищу
+            return any(data == item and (priority is None or node_priority == priority)
+                       for node_priority, _, data in self._storage)
         
-        return False
+        if counts is None:
+            return False
+        return priority is None or priority in counts
 
 
 # Альтернативная реализация с использованием стандартного heapq
@@ -285,6 +329,184 @@ class FastPriorityQueue:
         return len(self._heap) == 0
 
 
+# Реализация с раздельным хранением приоритетов и данных (SoA)
+class IntPriorityQueue:
+    """
+    Приоритетная очередь для целочисленных приоритетов.
+    
+    Приоритеты хранятся в компактном массиве array('q') по 8 байт,
+    данные - в параллельном списке. Перестановки выполняются
+    одновременно в обоих массивах. Порядок извлечения элементов
+    с равными приоритетами не гарантируется.
+    """
+    
+    def __init__(self):
+        """Инициализация пустой очереди."""
+        self._priorities = array('q')
+        self._items = []
+    
+    def push(self, item: Any, priority: int) -> None:
+        """
+        Добавление элемента.
+        
+        Параметры:
+            item: Элемент данных
+            priority: Целочисленный приоритет в диапазоне int64
+            
+        Сложность: O(log n)
+        """
+        priorities = self._priorities
+        items = self._items
+        priorities.append(priority)
+        items.append(item)
+        
+        # Просеивание вверх: родители сдвигаются вниз в «дырку»
+        index = len(priorities) - 1
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_priority = priorities[parent]
+            if parent_priority <= priority:
+                break
+            priorities[index] = parent_priority
+            items[index] = items[parent]
+            index = parent
+        
+        priorities[index] = priority
+        items[index] = item
+    
+    add = push  # Синоним для совместимости
+    enqueue = push
+    
+    def pop(self) -> Any:
+        """
+        Извлечение элемента с наивысшим приоритетом.
+        
+        Исключения:
+            IndexError: При попытке извлечения из пустой очереди
+            
+        Сложность: O(log n)
+        """
+        priorities = self._priorities
+        items = self._items
+        if not items:
+            raise IndexError("Очередь пуста")
+        
+        result = items[0]
+        priority = priorities.pop()
+        item = items.pop()
+        size = len(items)
+        
+        if size:
+            # Просеивание вниз последнего элемента от корня
+            index = 0
+            child = 1
+            while child < size:
+                right = child + 1
+                if right < size and priorities[right] < priorities[child]:
+                    child = right
+                child_priority = priorities[child]
+                if priority <= child_priority:
+                    break
+                priorities[index] = child_priority
+                items[index] = items[child]
+                index = child
+                child = 2 * index + 1
+            
+            priorities[index] = priority
+            items[index] = item
+        
+        return result
+    
+    remove = pop  # Синоним для совместимости
+    dequeue = pop
+    
+    def peek(self) -> Any:
+        """Просмотр элемента с наивысшим приоритетом. O(1)"""
+        if not self._items:
+            raise IndexError("Очередь пуста")
+        return self._items[0]
+    
+    front = peek
+    
+    def __len__(self) -> int:
+        """Размер очереди. O(1)"""
+        return len(self._items)
+    
+    def __bool__(self) -> bool:
+        """Проверка наличия элементов. O(1)"""
+        return bool(self._items)
+    
+    def is_empty(self) -> bool:
+        """Проверка пустоты. O(1)"""
+        return len(self._items) == 0
+    
+    def clear(self) -> None:
+        """Очистка очереди. O(n)"""
+        del self._priorities[:]
+        self._items.clear()
+
+
+def make_int_priority_queue(counter_bits: int = 40):
+    """
+    Создание класса очереди, специализированного под целые приоритеты.
+    
+    Приоритет и номер вставки упаковываются в одно целое число
+    (priority << counter_bits) + номер, поэтому heapq сравнивает
+    обычные int вместо кортежей, а данные хранятся отдельно в словаре.
+    Порядок FIFO при равных приоритетах сохраняется. Константы
+    упаковки и функции heapq подставляются в методы при создании класса.
+    
+    Параметры:
+        counter_bits: Разрядность счетчика вставок (допустимо
+            до 2**counter_bits вставок в одну очередь)
+            
+    Возвращает:
+        Класс очереди с методами push, pop, peek, __len__, is_empty
+    """
+    mask = (1 << counter_bits) - 1
+    
+    class PackedIntPriorityQueue:
+        """Приоритетная очередь с упакованными целочисленными ключами."""
+        
+        __slots__ = ('_heap', '_items', '_counter')
+        
+        def __init__(self):
+            """Инициализация пустой очереди."""
+            self._heap = []
+            self._items = {}
+            self._counter = 0
+        
+        def push(self, item: Any, priority: int,
+                 _heappush=std_heapq.heappush, _shift=counter_bits) -> None:
+            """Добавление элемента. O(log n)"""
+            counter = self._counter
+            self._counter = counter + 1
+            self._items[counter] = item
+            _heappush(self._heap, (priority << _shift) + counter)
+        
+        def pop(self, _heappop=std_heapq.heappop, _mask=mask) -> Any:
+            """Извлечение элемента с наивысшим приоритетом. O(log n)"""
+            if not self._heap:
+                raise IndexError("Очередь пуста")
+            return self._items.pop(_heappop(self._heap) & _mask)
+        
+        def peek(self, _mask=mask) -> Any:
+            """Просмотр элемента с наивысшим приоритетом. O(1)"""
+            if not self._heap:
+                raise IndexError("Очередь пуста")
+            return self._items[self._heap[0] & _mask]
+        
+        def __len__(self) -> int:
+            """Размер очереди. O(1)"""
+            return len(self._heap)
+        
+        def is_empty(self) -> bool:
+            """Проверка пустоты. O(1)"""
+            return not self._heap
+    
+    return PackedIntPriorityQueue
+
+
 # Пример использования
 def demonstrate_usage():
     """Демонстрация работы приоритетной очереди."""
@@ -365,6 +587,25 @@ def run_tests():
     assert len(iterated) == 3
     print("✓ Тест итерации пройден")
     
+    # Тест 5: Очередь с целочисленными приоритетами
+    int_queue = IntPriorityQueue()
+    for task, priority in [("A", 5), ("B", -1), ("C", 3), ("D", 0)]:
+        int_queue.push(task, priority)
+    
+    assert [int_queue.pop() for _ in range(4)] == ["B", "D", "C", "A"]
+    assert int_queue.is_empty()
+    print("✓ Тест IntPriorityQueue пройден")
+    
+    # Тест 6: Очередь с упакованными ключами
+    packed_queue = make_int_priority_queue()()
+    for task, priority in [("A", 2), ("B", -3), ("C", 2), ("D", 0)]:
+        packed_queue.push(task, priority)
+    
+    assert packed_queue.peek() == "B"
+    assert [packed_queue.pop() for _ in range(4)] == ["B", "D", "A", "C"]
+    assert packed_queue.is_empty()
+    print("✓ Тест make_int_priority_queue пройден")
+    
     print("\nВсе тесты пройдены успешно!")
 
 
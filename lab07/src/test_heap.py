@@ -2,62 +2,168 @@
 Набор тестов для проверки корректности реализации куч, сортировки и приоритетной очереди.
 """
 
+import heapq
+import importlib
+import io
+import operator
+import os
+import sys
 import unittest
 import random
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него тесты с массивами пропускаются
+    np = None
+
+# Служебные сообщения выводятся при прямом запуске или по переменной окружения,
+# чтобы импорт модуля раннерами тестов не выполнял лишний вывод
+VERBOSE = __name__ == "__main__" or bool(os.environ.get("HEAP_TESTS_VERBOSE"))
+
+# Импорт тестируемых модулей: ошибки накапливаются, чтобы сломанный
+# модуль не скрывал проблемы в остальных
+_import_errors = []
 
-# Импорт тестируемых модулей
 try:
     from heap import MinHeap, MaxHeap, Heap
-    print("✓ Импортирован модуль heap")
+    if VERBOSE:
+        print("✓ Импортирован модуль heap")
 except ImportError as e:
-    print(f"Ошибка импорта heap: {e}")
-    exit(1)
+    _import_errors.append(('heap', e))
 
 try:
-    from heapsort import heapsort, heapsort_inplace, heap_sort_min
-    print("✓ Импортирован модуль heapsort")
+    from heapsort import heapsort, heapsort_inplace, heap_sort_min, heap_sort_top_k, heap_sort_bulk
+    if VERBOSE:
+        print("✓ Импортирован модуль heapsort")
 except ImportError as e:
-    print(f"Ошибка импорта heapsort: {e}")
-    exit(1)
+    _import_errors.append(('heapsort', e))
 
+# Один импорт модуля и поиск классов среди возможных имен
 try:
-    # Пробуем импортировать разные варианты имен классов
-    from priority_queue import PriorityQueue, PriorityItem
-    print("✓ Импортирован модуль priority_queue (старые имена)")
-except ImportError:
+    _pq_module = importlib.import_module('priority_queue')
+    _pq_error = None
+except ImportError as e:
+    _pq_module = None
+    _pq_error = e
+
+PriorityQueue = next((getattr(_pq_module, name)
+                      for name in ('PriorityQueue', 'HeapPriorityQueue', 'PriorityQueueSystem')
+                      if hasattr(_pq_module, name)), None)
+PriorityItem = next((getattr(_pq_module, name)
+                     for name in ('PriorityItem', 'PriorityNode')
+                     if hasattr(_pq_module, name)), None)
+
+if PriorityQueue is None or PriorityItem is None:
+    _import_errors.append(('priority_queue', _pq_error or 'классы не найдены'))
+
+
+def _print_priority_queue_hint():
+    """Выводит подсказку по содержимому priority_queue.py."""
+    print("\nПроверьте, что в файле priority_queue.py есть один из следующих классов:")
+    print("  - PriorityQueue или HeapPriorityQueue или PriorityQueueSystem")
+    print("  - PriorityItem или PriorityNode")
+    print("\nСодержимое файла priority_queue.py:")
     try:
-        # Пробуем новые имена из перефразированного кода
-        from priority_queue import HeapPriorityQueue as PriorityQueue, PriorityNode as PriorityItem
-        print("✓ Импортирован модуль priority_queue (новые имена)")
-    except ImportError:
-        try:
-            # Пробуем другие варианты
-            from priority_queue import PriorityQueueSystem, PriorityNode
-            # Создаем алиасы для совместимости
-            PriorityQueue = PriorityQueueSystem
-            PriorityItem = PriorityNode
-            print("✓ Импортирован модуль priority_queue (системные имена)")
-        except ImportError as e:
-            print(f"Ошибка импорта priority_queue: {e}")
-            print("\nПроверьте, что в файле priority_queue.py есть один из следующих классов:")
-            print("  - PriorityQueue или HeapPriorityQueue или PriorityQueueSystem")
-            print("  - PriorityItem или PriorityNode")
-            print("\nСодержимое файла priority_queue.py:")
-            try:
-                with open('priority_queue.py', 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for i, line in enumerate(lines[:20]):
-                        print(f"  {i+1:3}: {line.rstrip()}")
-                    if len(lines) > 20:
-                        print(f"  ... и еще {len(lines)-20} строк")
-            except:
-                print("  Не удалось прочитать файл")
-            exit(1)
+        # Читаем только первые 20 строк, а не весь файл
+        with open('priority_queue.py', 'r', encoding='utf-8') as f:
+            head = list(islice(f, 20))
+            has_more = f.readline() != ''
+        sys.stdout.write(''.join(f"  {i+1:3}: {line.rstrip()}\n"
+                                 for i, line in enumerate(head)))
+        if has_more:
+            print("  ... и еще строки")
+    except:
+        print("  Не удалось прочитать файл")
+
+
+_failed_modules = {name for name, _ in _import_errors}
+
+if _import_errors and __name__ == "__main__":
+    # При прямом запуске сообщаем обо всех ошибках сразу
+    for module_name, error in _import_errors:
+        print(f"Ошибка импорта {module_name}: {error}")
+    if 'priority_queue' in _failed_modules:
+        _print_priority_queue_hint()
+    sys.exit(1)
+
+
+def _requires(*modules):
+    """Пропускает TestCase, если нужные ему модули не импортировались."""
+    missing = [name for name in modules if name in _failed_modules]
+    return unittest.skipIf(bool(missing), f"не импортированы модули: {missing}")
+
+
+if VERBOSE and PriorityQueue is not None:
+    # PriorityItem может отсутствовать: об этом уже сообщает _import_errors
+    print(f"✓ Импортирован модуль priority_queue ({PriorityQueue.__name__}, "
+          f"{getattr(PriorityItem, '__name__', None)})")
+
 
+# Возможные имена методов приоритетной очереди
+_PUSH_NAMES = ('enqueue', 'add', 'push')
+_POP_NAMES = ('dequeue', 'remove', 'pop')
+_PEEK_NAMES = ('peek', 'front')
 
+# Определяем API приоритетной очереди один раз при импорте
+_push_name = next((name for name in _PUSH_NAMES
+                   if hasattr(PriorityQueue, name)), None)
+_pop_name = next((name for name in _POP_NAMES
+                  if hasattr(PriorityQueue, name)), None)
+_peek_name = next((name for name in _PEEK_NAMES
+                   if hasattr(PriorityQueue, name)), None)
+
+_HAS_PUSH_POP = _push_name is not None and _pop_name is not None
+_HAS_PEEK = _peek_name is not None
+
+
+def _push(pq, item, priority):
+    """Добавление элемента в очередь через обнаруженный метод."""
+    getattr(pq, _push_name)(item, priority)
+
+
+def _pop(pq):
+    """Извлечение элемента из очереди через обнаруженный метод."""
+    return getattr(pq, _pop_name)()
+
+
+def _peek(pq):
+    """Просмотр элемента очереди через обнаруженный метод."""
+    return getattr(pq, _peek_name)()
+
+
+def _build_via_bulk(heap, data):
+    """Построение кучи из данных за O(n) (алгоритм Флойда)."""
+    heap.build_heap(list(data))
+    return heap
+
+
+def _drain(heap):
+    """
+    Элементы кучи в порядке извлечения ее собственным методом extract().
+    
+    Куча при этом опустошается.
+    """
+    return [heap.extract() for _ in range(len(heap))]
+
+
+def _make_random_data(n=1000, seed=0):
+    """Воспроизводимый набор из n различных случайных чисел."""
+    return random.Random(seed).sample(range(1, 10_001), n)
+
+
+@_requires('heap', 'heapsort')
 class TestHeap(unittest.TestCase):
     """Тесты для класса Heap и его наследников."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Однократная генерация случайных данных для тестов класса."""
+        cls._data = _make_random_data()
+        cls._sorted = sorted(cls._data)
+    
     def test_min_heap_basic_operations(self):
         """Базовые операции с минимальной кучей."""
         heap = MinHeap()
@@ -74,12 +180,10 @@ class TestHeap(unittest.TestCase):
         self.assertEqual(len(heap), 5)
         self.assertEqual(heap.peek(), 3)
         
-        # Извлекаем элементы в порядке возрастания
-        extracted = []
-        while len(heap) > 0:
-            extracted.append(heap.extract())
-        
-        self.assertEqual(extracted, [3, 5, 7, 10, 15])
+        # Извлекаем корень, остальные элементы - в порядке возрастания
+        self.assertEqual(heap.extract(), 3)
+        self.assertTrue(heap.is_valid())
+        self.assertEqual(_drain(heap), [5, 7, 10, 15])
     
     def test_max_heap_basic_operations(self):
         """Базовые операции с максимальной кучей."""
@@ -97,12 +201,10 @@ class TestHeap(unittest.TestCase):
         self.assertEqual(len(heap), 5)
         self.assertEqual(heap.peek(), 15)
         
-        # Извлекаем элементы в порядке убывания
-        extracted = []
-        while len(heap) > 0:
-            extracted.append(heap.extract())
-        
-        self.assertEqual(extracted, [15, 10, 7, 5, 3])
+        # Извлекаем корень, остальные элементы - в порядке убывания
+        self.assertEqual(heap.extract(), 15)
+        self.assertTrue(heap.is_valid())
+        self.assertEqual(_drain(heap), [10, 7, 5, 3])
     
     def test_heap_from_array(self):
         """Построение кучи из массива."""
@@ -145,14 +247,21 @@ class TestHeap(unittest.TestCase):
     
     def test_random_large_heap(self):
         """Тест с большим количеством случайных элементов."""
+        heap = _build_via_bulk(MinHeap(), self._data)
+        
+        self.assertTrue(heap.is_valid())
+        self.assertEqual(heap.peek(), self._sorted[0])
+        self.assertEqual(_drain(heap), self._sorted)
+    
+    def test_insert_sequence(self):
+        """Поэлементная вставка сохраняет свойства кучи."""
         heap = MinHeap()
-        n = 1000
-        random_data = [random.randint(1, 10000) for _ in range(n)]
+        rng = random.Random(4)
+        random_data = [rng.randint(1, 100) for _ in range(20)]
         
         for item in random_data:
             heap.insert(item)
-        
-        self.assertTrue(heap.is_valid())
+            self.assertTrue(heap.is_valid())
         
         extracted = []
         while len(heap) > 0:
@@ -175,11 +284,39 @@ class TestHeap(unittest.TestCase):
         heap_max.insert(3)
         heap_max.insert(7)
         self.assertEqual(heap_max.peek(), 7)
+    
+    def test_replace(self):
+        """replace() возвращает старый корень и сохраняет свойства кучи."""
+        data = _make_random_data(100, seed=2)
+        heap = _build_via_bulk(MinHeap(), data)
+        
+        self.assertEqual(heap.replace(10_001), min(data))
+        self.assertTrue(heap.is_valid())
+        # Новый элемент больше всех: корнем становится второй минимум
+        self.assertEqual(heap.peek(), sorted(data)[1])
+        self.assertEqual(len(heap), len(data))
+        
+        max_heap = _build_via_bulk(MaxHeap(), data)
+        self.assertEqual(max_heap.replace(0), max(data))
+        self.assertTrue(max_heap.is_valid())
+        self.assertEqual(max_heap.peek(), sorted(data)[-2])
+    
+    def test_replace_empty(self):
+        """replace() на пустой куче."""
+        with self.assertRaises(IndexError):
+            MinHeap().replace(1)
 
 
+@_requires('heap', 'heapsort')
 class TestHeapSort(unittest.TestCase):
     """Тесты для сортировки кучей."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Однократная генерация случайных данных для тестов класса."""
+        cls._data = _make_random_data()
+        cls._sorted = sorted(cls._data)
+    
     def test_heapsort_basic(self):
         """Базовый тест сортировки."""
         test_data = [9, 5, 7, 1, 3, 8, 2, 6, 4]
@@ -231,97 +368,99 @@ class TestHeapSort(unittest.TestCase):
     
     def test_large_random_array(self):
         """Сортировка большого случайного массива."""
-        n = 1000
-        random_data = [random.randint(1, 10000) for _ in range(n)]
+        random_data = self._data
+        expected = self._sorted
         
         # Тестируем все три реализации
-        result1 = heapsort(random_data)
-        self.assertEqual(result1, sorted(random_data))
-        
-        random_copy = random_data.copy()
-        result2 = heapsort_inplace(random_copy)
-        self.assertEqual(result2, sorted(random_data))
-        
-        result3 = heap_sort_min(random_data)
-        self.assertEqual(result3, sorted(random_data))
+        self.assertEqual(heapsort(random_data), expected)
+        self.assertEqual(heapsort_inplace(list(random_data)), expected)
+        self.assertEqual(heap_sort_min(random_data), expected)
+    
+    def test_large_random_array_heapq_oracle(self):
+        """Сверка с эталоном на основе heapq (с повторяющимися ключами)."""
+        data = random.Random(1).choices(range(100), k=1000)
+        expected = heapq.nsmallest(len(data), data)
+        
+        self.assertEqual(heapsort(data), expected)
+        self.assertEqual(heapsort_inplace(list(data)), expected)
+    
+    def test_top_k(self):
+        """k наименьших элементов по возрастанию."""
+        data = self._data
+        self.assertEqual(heap_sort_top_k(data, 10), self._sorted[:10])
+        self.assertEqual(heap_sort_top_k(data, len(data) + 5), self._sorted)
+        self.assertEqual(heap_sort_top_k(data, 0), [])
+        self.assertEqual(heap_sort_top_k([], 3), [])
+    
+    def test_bulk_lists(self):
+        """Построчная сортировка списка списков."""
+        rows = [[3, 1, 2], [], [5, 5, 4], ["b", "a"]]
+        self.assertEqual(heap_sort_bulk(rows), [[1, 2, 3], [], [4, 5, 5], ["a", "b"]])
+        # Исходные строки не меняются
+        self.assertEqual(rows[0], [3, 1, 2])
+    
+    @unittest.skipIf(np is None, "numpy не установлен")
+    def test_bulk_arrays(self):
+        """Построчная сортировка numpy-массивов разных типов и размерностей."""
+        rng = np.random.default_rng(3)
+        for matrix in (rng.integers(-50, 50, size=(6, 40)),
+                       rng.random((4, 17)),
+                       np.array([["b", "c", "a"], ["z", "x", "y"]]),
+                       np.array([[3, 1, 2], [2**70, 0, -1]], dtype=object)):
+            result = heap_sort_bulk(matrix)
+            self.assertIsNot(result, matrix)
+            self.assertEqual(result.tolist(), [sorted(row) for row in matrix.tolist()])
+        
+        # Одномерный массив сортируется как одна строка
+        self.assertEqual(heap_sort_bulk(np.array([3, 1, 2])).tolist(), [1, 2, 3])
+        
+        with self.assertRaises(ValueError):
+            heap_sort_bulk(np.zeros((2, 2, 2)))
 
 
+@_requires('priority_queue')
+@unittest.skipUnless(_HAS_PUSH_POP, "нет методов добавления/извлечения")
 class TestPriorityQueue(unittest.TestCase):
     """Тесты для приоритетной очереди."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Подготовка вызовов методов извлечения и просмотра."""
+        cls._extract = operator.methodcaller(_pop_name)
+        cls._view = operator.methodcaller(_peek_name) if _HAS_PEEK else None
+    
     def test_basic_operations(self):
         """Базовые операции с приоритетной очередью."""
         pq = PriorityQueue()
         
-        # Пробуем разные методы добавления
-        if hasattr(pq, 'enqueue'):
-            pq.enqueue("Task 1", 3)
-            pq.enqueue("Task 2", 1)
-            pq.enqueue("Task 3", 5)
-            pq.enqueue("Task 4", 2)
-        elif hasattr(pq, 'add'):
-            pq.add("Task 1", 3)
-            pq.add("Task 2", 1)
-            pq.add("Task 3", 5)
-            pq.add("Task 4", 2)
-        elif hasattr(pq, 'push'):
-            pq.push("Task 1", 3)
-            pq.push("Task 2", 1)
-            pq.push("Task 3", 5)
-            pq.push("Task 4", 2)
-        else:
-            # Пробуем вызвать метод с параметрами
-            try:
-                pq.enqueue("Task 1", 3)
-                pq.enqueue("Task 2", 1)
-                pq.enqueue("Task 3", 5)
-                pq.enqueue("Task 4", 2)
-            except:
-                self.fail("Не найден метод для добавления элементов в очередь")
+        _push(pq, "Task 1", 3)
+        _push(pq, "Task 2", 1)
+        _push(pq, "Task 3", 5)
+        _push(pq, "Task 4", 2)
         
         # Проверяем порядок извлечения
-        if hasattr(pq, 'dequeue'):
-            self.assertEqual(pq.dequeue(), "Task 2")  # Приоритет 1
-            self.assertEqual(pq.dequeue(), "Task 4")  # Приоритет 2
-            self.assertEqual(pq.dequeue(), "Task 1")  # Приоритет 3
-            self.assertEqual(pq.dequeue(), "Task 3")  # Приоритет 5
-        elif hasattr(pq, 'remove'):
-            self.assertEqual(pq.remove(), "Task 2")
-            self.assertEqual(pq.remove(), "Task 4")
-            self.assertEqual(pq.remove(), "Task 1")
-            self.assertEqual(pq.remove(), "Task 3")
-        elif hasattr(pq, 'pop'):
-            self.assertEqual(pq.pop(), "Task 2")
-            self.assertEqual(pq.pop(), "Task 4")
-            self.assertEqual(pq.pop(), "Task 1")
-            self.assertEqual(pq.pop(), "Task 3")
+        self.assertEqual(_pop(pq), "Task 2")  # Приоритет 1
+        self.assertEqual(_pop(pq), "Task 4")  # Приоритет 2
+        self.assertEqual(_pop(pq), "Task 1")  # Приоритет 3
+        self.assertEqual(_pop(pq), "Task 3")  # Приоритет 5
         
         self.assertTrue(pq.is_empty())
     
+    @unittest.skipUnless(_HAS_PEEK, "peek/front не реализован")
     def test_peek_operation(self):
         """Просмотр элемента без извлечения."""
         pq = PriorityQueue()
         
-        # Добавляем элементы
-        if hasattr(pq, 'enqueue'):
-            pq.enqueue("Task A", 2)
-            pq.enqueue("Task B", 1)
-        elif hasattr(pq, 'add'):
-            pq.add("Task A", 2)
-            pq.add("Task B", 1)
+        _push(pq, "Task A", 2)
+        _push(pq, "Task B", 1)
         
         # Peek должен показывать элемент с наивысшим приоритетом
-        if hasattr(pq, 'peek'):
-            self.assertEqual(pq.peek(), "Task B")
-        elif hasattr(pq, 'front'):
-            self.assertEqual(pq.front(), "Task B")
-        
+        self.assertEqual(_peek(pq), "Task B")
         self.assertEqual(len(pq), 2)  # Размер не должен измениться
         
         # После извлечения peek должен показывать следующий
-        if hasattr(pq, 'dequeue'):
-            self.assertEqual(pq.dequeue(), "Task B")
-            self.assertEqual(pq.peek(), "Task A")
+        self.assertEqual(_pop(pq), "Task B")
+        self.assertEqual(_peek(pq), "Task A")
     
     def test_empty_queue(self):
         """Работа с пустой очередью."""
@@ -330,45 +469,49 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertTrue(pq.is_empty())
         self.assertEqual(len(pq), 0)
         
-        # Проверяем разные методы извлечения
-        methods_to_try = ['dequeue', 'remove', 'pop']
-        for method_name in methods_to_try:
-            if hasattr(pq, method_name):
-                with self.assertRaises(IndexError):
-                    getattr(pq, method_name)()
-                break
-        
-        # Проверяем разные методы просмотра
-        view_methods = ['peek', 'front']
-        for method_name in view_methods:
-            if hasattr(pq, method_name):
-                with self.assertRaises(IndexError):
-                    getattr(pq, method_name)()
-                break
+        with self.assertRaises(IndexError):
+            self._extract(pq)
+        
+        # Просмотр проверяется, только если очередь его поддерживает
+        if _HAS_PEEK:
+            with self.assertRaises(IndexError):
+                self._view(pq)
     
     def test_same_priority(self):
         """Элементы с одинаковым приоритетом."""
         pq = PriorityQueue()
         
         # Добавляем элементы с одинаковым приоритетом
-        if hasattr(pq, 'enqueue'):
-            pq.enqueue("Task 1", 1)
-            pq.enqueue("Task 2", 1)
-            pq.enqueue("Task 3", 1)
-        elif hasattr(pq, 'add'):
-            pq.add("Task 1", 1)
-            pq.add("Task 2", 1)
-            pq.add("Task 3", 1)
+        _push(pq, "Task 1", 1)
+        _push(pq, "Task 2", 1)
+        _push(pq, "Task 3", 1)
         
         # Извлекаем все задачи
-        tasks = set()
+        tasks = []
         while not pq.is_empty():
-            if hasattr(pq, 'dequeue'):
-                tasks.add(pq.dequeue())
-            elif hasattr(pq, 'remove'):
-                tasks.add(pq.remove())
+            tasks.append(_pop(pq))
+        
+        self.assertEqual(sorted(tasks), ["Task 1", "Task 2", "Task 3"])
+    
+    def test_iteration_keeps_queue(self):
+        """Итерация не изменяет очередь."""
+        pq = PriorityQueue([("Task 1", 3), ("Task 2", 1), ("Task 3", 2)])
+        
+        self.assertEqual(list(pq), ["Task 2", "Task 3", "Task 1"])
+        self.assertEqual(len(pq), 3)
+        self.assertEqual(list(pq), ["Task 2", "Task 3", "Task 1"])
+    
+    def test_contains(self):
+        """Проверка наличия элемента с учетом приоритета."""
+        pq = PriorityQueue([("Task 1", 3), ("Task 2", 1)])
         
-        self.assertEqual(tasks, {"Task 1", "Task 2", "Task 3"})
+        self.assertTrue(pq.contains("Task 1"))
+        self.assertTrue(pq.contains("Task 1", 3))
+        self.assertFalse(pq.contains("Task 1", 1))
+        
+        pq.dequeue()
+        self.assertFalse(pq.contains("Task 2"))
+        self.assertTrue(pq.contains("Task 1"))
     
     def test_priority_item_comparison(self):
         """Сравнение элементов приоритетной очереди."""
@@ -403,60 +546,89 @@ def detect_priority_queue_api():
             'methods': []
         }
         
-        # Проверяем методы
-        for attr_name in dir(pq):
-            if not attr_name.startswith('_'):
-                attr = getattr(pq, attr_name)
-                if callable(attr):
-                    api_info['methods'].append(attr_name)
+        # Проверяем методы по словарям классов, не вызывая дескрипторы
+        methods = [name
+                   for cls in type(pq).__mro__ if cls is not object
+                   for name, value in vars(cls).items()
+                   if not name.startswith('_') and callable(value)]
+        api_info['methods'] = list(dict.fromkeys(methods))
         
         return api_info
     except:
         return None
 
 
+def _run_suite(class_name):
+    """
+    Запуск одного набора тестов (выполняется в процессе-обработчике).
+    
+    Параметры:
+        class_name: Имя класса TestCase в этом модуле
+        
+    Возвращает:
+        Кортеж (отчет, число тестов, проваленные тесты, тесты с ошибками)
+    """
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[class_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    
+    return (stream.getvalue(),
+            result.testsRun,
+            [str(test) for test, _ in result.failures],
+            [str(test) for test, _ in result.errors])
+
+
 def run_all_tests():
     """Запуск всех тестов."""
-    print("\n" + "=" * 60)
-    print("ЗАПУСК ТЕСТОВ СТРУКТУР ДАННЫХ")
-    print("=" * 60)
-    
-    # Определяем API приоритетной очереди
-    api_info = detect_priority_queue_api()
-    if api_info:
-        print(f"\nОбнаружен класс: {api_info['class_name']}")
-        print(f"Методы: {', '.join(sorted(api_info['methods']))}")
-    
-    # Создаем тестовый набор
-    test_suite = unittest.TestLoader().loadTestsFromTestCase(TestHeap)
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestHeapSort))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPriorityQueue))
-    
-    # Запускаем тесты
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    if VERBOSE:
+        print("\n" + "=" * 60)
+        print("ЗАПУСК ТЕСТОВ СТРУКТУР ДАННЫХ")
+        print("=" * 60)
+        
+        # Определяем API приоритетной очереди
+        api_info = detect_priority_queue_api()
+        if api_info:
+            print(f"\nОбнаружен класс: {api_info['class_name']}")
+            print(f"Методы: {', '.join(sorted(api_info['methods']))}")
+    
+    # Один проход загрузчика по модулю находит все классы TestCase;
+    # независимые наборы тестов выполняются в отдельных процессах
+    module_suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    suite_names = [type(next(iter(class_suite))).__name__
+                   for class_suite in module_suite if class_suite.countTestCases()]
+    with ProcessPoolExecutor(max_workers=len(suite_names)) as executor:
+        outcomes = list(executor.map(_run_suite, suite_names))
+    
+    tests_run = 0
+    failures = []
+    errors = []
+    for report, suite_run, suite_failures, suite_errors in outcomes:
+        print(report, end="")
+        tests_run += suite_run
+        failures.extend(suite_failures)
+        errors.extend(suite_errors)
     
     # Выводим статистику
     print("\n" + "=" * 60)
     print("СТАТИСТИКА ТЕСТОВ:")
-    print(f"Всего тестов: {result.testsRun}")
-    print(f"Успешно: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Провалено: {len(result.failures)}")
-    print(f"Ошибок: {len(result.errors)}")
+    print(f"Всего тестов: {tests_run}")
+    print(f"Успешно: {tests_run - len(failures) - len(errors)}")
+    print(f"Провалено: {len(failures)}")
+    print(f"Ошибок: {len(errors)}")
     
-    if result.failures:
+    if failures:
         print("\nПроваленные тесты:")
-        for test, traceback in result.failures:
+        for test in failures:
             print(f"  - {test}")
     
-    if result.errors:
+    if errors:
         print("\nТесты с ошибками:")
-        for test, traceback in result.errors:
+        for test in errors:
             print(f"  - {test}")
     
     print("=" * 60)
     
-    return result.wasSuccessful()
+    return not failures and not errors
 
 
 def quick_test():
@@ -496,16 +668,9 @@ def quick_test():
         # Тест приоритетной очереди
         print("3. Тестируем PriorityQueue...")
         pq = PriorityQueue()
-        
-        # Пробуем разные методы
-        if hasattr(pq, 'enqueue'):
-            pq.enqueue("A", 2)
-            pq.enqueue("B", 1)
-            assert pq.dequeue() == "B"
-        elif hasattr(pq, 'add'):
-            pq.add("A", 2)
-            pq.add("B", 1)
-            assert pq.remove() == "B"
+        _push(pq, "A", 2)
+        _push(pq, "B", 1)
+        assert _pop(pq) == "B"
         
         print("   ✓ PriorityQueue работает корректно")
         success_count += 1
@@ -523,8 +688,6 @@ def quick_test():
 
 if __name__ == "__main__":
     # Проверяем аргументы командной строки
-    import sys
-    
     print("Загрузка тестов...")
     
     if len(sys.argv) > 1 and sys.argv[1] == "quick":
@@ -2,16 +2,135 @@
 Модуль графического представления структуры данных "Куча" в виде древовидной диаграммы.
 """
 
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from typing import Any, List, Optional
+import io
+import os
 import sys
 
 
+# Заранее закодированные элементы рисунка дерева: строки собираются
+# в bytearray и декодируются один раз в конце
+B_PIPE = "│   ".encode('utf-8')
+B_SPACE = b"    "
+B_L_LEFT = "└── ".encode('utf-8')
+B_L_RIGHT = "┌── ".encode('utf-8')
+B_NL = b"\n"
+
+# Готовые подписи для небольших целых чисел (типичные значения в демонстрациях)
+_SMALL_INT_MIN = -256
+_SMALL_INT_MAX = 4096
+_SMALL_INT_LABELS = tuple(str(i).encode('ascii')
+                          for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX))
+
+
+@lru_cache(maxsize=4096)
+def _extend_prefix(branch_prefix: bytes, draw_line: bool) -> bytes:
+    """
+    Префикс для потомка узла.
+    
+    Набор префиксов ограничен высотой дерева, поэтому одинаковые строки
+    берутся из кэша, а не создаются заново для каждого узла.
+    """
+    return branch_prefix + (B_PIPE if draw_line else B_SPACE)
+
+
+@contextmanager
+def _buffered_output():
+    """
+    Сбор вывода блока в памяти с одной записью в stdout в конце.
+    
+    Вместо десятков мелких print на терминал уходит одна запись.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def _get_heap_data(heap_structure) -> List[Any]:
+    """
+    Получение массива элементов кучи (атрибут .data или .heap).
+    
+    Вызывается один раз на публичную операцию, дальше передается сам массив.
+    """
+    heap_data = getattr(heap_structure, 'data', None)  # Для нового синтаксиса
+    if heap_data is None:
+        heap_data = heap_structure.heap  # Для обратной совместимости
+    return heap_data
+
+
+def _emit_tree_lines(heap_data, node_index: int, branch_prefix: bytes,
+                     is_left_child: bool, write) -> None:
+    """
+    Запись строк поддерева через функцию write (обратный симметричный обход).
+    
+    Обход выполняется явным стеком, а не рекурсией: нет накладных расходов
+    на вызовы функций и нет риска RecursionError.
+    
+    Параметры:
+        heap_data: Массив элементов кучи
+        node_index: Индекс текущего узла в массиве кучи
+        branch_prefix: Префикс для форматирования ветвей в UTF-8
+        is_left_child: Флаг, указывающий является ли узел левым потомком
+        write: Приемник байтов UTF-8: bytearray.extend для сборки в памяти
+               или file.write для потоковой записи в двоичный файл
+    """
+    size = len(heap_data)
+    # Подписи повторяющихся целых значений кодируются один раз за вызов.
+    # Кэш только для int: у равных значений других типов (1 и 1.0,
+    # 0.0 и -0.0) строковое представление может различаться
+    int_labels = {}
+    # Элементы стека: (индекс, префикс, левый ли потомок, пора ли выводить узел)
+    stack = [(node_index, branch_prefix, is_left_child, False)]
+    
+    while stack:
+        index, prefix, is_left, emit = stack.pop()
+        
+        if emit:
+            # Записываем строку текущего узла
+            write(prefix)
+            write(B_L_LEFT if is_left else B_L_RIGHT)
+            value = heap_data[index]
+            if type(value) is int:
+                if _SMALL_INT_MIN <= value < _SMALL_INT_MAX:
+                    label = _SMALL_INT_LABELS[value - _SMALL_INT_MIN]
+                else:
+                    label = int_labels.get(value)
+                    if label is None:
+                        label = int_labels[value] = str(value).encode('utf-8')
+            else:
+                label = str(value).encode('utf-8')
+            write(label)
+            write(B_NL)
+            continue
+        
+        # Кладем в обратном порядке: правое поддерево, узел, левое поддерево.
+        # Вертикальная линия нужна, когда ветвь меняет направление
+        left_child_idx = 2 * index + 1
+        if left_child_idx < size:
+            stack.append((left_child_idx,
+                          _extend_prefix(prefix, not is_left), True, False))
+        stack.append((index, prefix, is_left, True))
+        right_child_idx = left_child_idx + 1
+        if right_child_idx < size:
+            stack.append((right_child_idx,
+                          _extend_prefix(prefix, is_left), False, False))
+
+
 def represent_heap_as_tree(heap_structure, 
                           node_index: int = 0, 
                           branch_prefix: str = "", 
                           is_left_child: bool = True) -> str:
     """
-    Рекурсивное формирование текстового представления кучи в виде дерева.
+    Формирование текстового представления кучи в виде дерева.
+    
+    Строки всех узлов пишутся в один буфер, поэтому результат строится
+    за линейное время, без повторного копирования строк поддеревьев.
     
     Параметры:
         heap_structure: Структура кучи с атрибутом .data или .heap
@@ -22,44 +141,17 @@ def represent_heap_as_tree(heap_structure,
     Возвращает:
         Многострочное строковое представление дерева
     """
-    # Получаем доступ к данным кучи
-    try:
-        heap_data = heap_structure.data  # Для нового синтаксиса
-    except AttributeError:
-        heap_data = heap_structure.heap  # Для обратной совместимости
+    # Получаем доступ к данным кучи один раз
+    heap_data = _get_heap_data(heap_structure)
     
     # Если индекс выходит за границы массива
     if node_index >= len(heap_data):
         return ""
     
-    representation = ""
-    
-    # Обрабатываем правого потомка (если существует)
-    right_child_idx = 2 * node_index + 2
-    if right_child_idx < len(heap_data):
-        representation += represent_heap_as_tree(
-            heap_structure,
-            right_child_idx,
-            branch_prefix + ("│   " if is_left_child else "    "),
-            False
-        )
-    
-    # Формируем строку текущего узла
-    node_connector = "└── " if is_left_child else "┌── "
-    current_line = branch_prefix + node_connector + str(heap_data[node_index])
-    representation += current_line + "\n"
-    
-    # Обрабатываем левого потомка (если существует)
-    left_child_idx = 2 * node_index + 1
-    if left_child_idx < len(heap_data):
-        representation += represent_heap_as_tree(
-            heap_structure,
-            left_child_idx,
-            branch_prefix + ("    " if is_left_child else "│   "),
-            True
-        )
-    
-    return representation
+    buffer = bytearray()
+    _emit_tree_lines(heap_data, node_index, branch_prefix.encode('utf-8'),
+                     is_left_child, buffer.extend)
+    return buffer.decode('utf-8')
 
 
 def display_heap_tree(heap_structure, 
@@ -72,10 +164,7 @@ def display_heap_tree(heap_structure,
         title: Заголовок для вывода (если None, используется стандартный)
     """
     # Получаем данные кучи
-    try:
-        heap_data = heap_structure.data
-    except AttributeError:
-        heap_data = heap_structure.heap
+    heap_data = _get_heap_data(heap_structure)
     
     if not heap_data:
         print("╭─────────────────────╮")
@@ -89,7 +178,9 @@ def display_heap_tree(heap_structure,
         print("\n▌ Древовидная структура кучи ▌")
         print("─" * 40)
     
-    print(represent_heap_as_tree(heap_structure))
+    buffer = bytearray()
+    _emit_tree_lines(heap_data, 0, b"", True, buffer.extend)
+    print(buffer.decode('utf-8'))
 
 
 def visualize_array_as_heap(data_array: List[Any]) -> None:
@@ -131,65 +222,44 @@ def create_demo_heap():
         from heap import MinHeap
         heap_demo = MinHeap()
     except ImportError:
-        # Альтернативная реализация для демонстрации
+        # Альтернативная реализация для демонстрации на основе heapq:
+        # просеивание выполняется в C и сдвигает элементы в «дырку»
+        # вместо попарных обменов
+        import heapq
+        
         class SimpleMinHeap:
             def __init__(self):
                 self.data = []
             
             def add(self, value):
-                self.data.append(value)
-                # Упрощенное восстановление свойств кучи
-                idx = len(self.data) - 1
-                while idx > 0:
-                    parent = (idx - 1) // 2
-                    if self.data[idx] < self.data[parent]:
-                        self.data[idx], self.data[parent] = self.data[parent], self.data[idx]
-                        idx = parent
-                    else:
-                        break
+                heapq.heappush(self.data, value)
             
             def remove_min(self):
                 if not self.data:
                     raise IndexError("Куча пуста")
                 
-                min_val = self.data[0]
-                last_val = self.data.pop()
-                
-                if self.data:
-                    self.data[0] = last_val
-                    idx = 0
-                    n = len(self.data)
-                    
-                    while True:
-                        left = 2 * idx + 1
-                        right = 2 * idx + 2
-                        smallest = idx
-                        
-                        if left < n and self.data[left] < self.data[smallest]:
-                            smallest = left
-                        if right < n and self.data[right] < self.data[smallest]:
-                            smallest = right
-                        
-                        if smallest != idx:
-                            self.data[idx], self.data[smallest] = self.data[smallest], self.data[idx]
-                            idx = smallest
-                        else:
-                            break
-                
-                return min_val
+                return heapq.heappop(self.data)
         
         heap_demo = SimpleMinHeap()
     
     return heap_demo
 
 
-def demonstrate_heap_visualization():
+def demonstrate_heap_visualization(headless: Optional[bool] = None):
     """
     Интерактивная демонстрация визуализации операций с кучей.
+    
+    Параметры:
+        headless: Не ждать нажатия Enter между шагами. По умолчанию
+                  определяется переменной окружения HEAP_DEMO_HEADLESS
     """
-    print("╔═══════════════════════════════════════════════════════╗")
-    print("║    ИНТЕРАКТИВНАЯ ВИЗУАЛИЗАЦИЯ СТРУКТУРЫ КУЧИ         ║")
-    print("╚═══════════════════════════════════════════════════════╝")
+    if headless is None:
+        headless = bool(os.environ.get('HEAP_DEMO_HEADLESS'))
+    
+    with _buffered_output():
+        print("╔═══════════════════════════════════════════════════════╗")
+        print("║    ИНТЕРАКТИВНАЯ ВИЗУАЛИЗАЦИЯ СТРУКТУРЫ КУЧИ         ║")
+        print("╚═══════════════════════════════════════════════════════╝")
     
     heap_instance = create_demo_heap()
     
@@ -213,39 +283,37 @@ def demonstrate_heap_visualization():
     step_counter = 1
     
     for description, operation, value in demonstration_sequence:
-        print(f"\n{'═' * 60}")
-        print(f"Шаг {step_counter}: {description}")
-        print(f"{'─' * 60}")
-        
-        if operation == "add" and value is not None:
-            heap_instance.add(value)
-            print(f"✓ Добавлен элемент: {value}")
-        elif operation == "remove":
-            try:
-                removed = heap_instance.remove_min()
-                print(f"✓ Удален элемент: {removed}")
-            except IndexError:
-                print("✗ Куча пуста, удаление невозможно")
-        
-        # Отображаем текущее состояние кучи
-        display_heap_tree(heap_instance)
-        
-        # Показываем содержимое массива
-        try:
-            heap_array = heap_instance.data
-        except AttributeError:
-            heap_array = heap_instance.heap
-        
-        print(f"\nМассив кучи: {heap_array}")
+        # Вывод шага собирается целиком и печатается перед паузой
+        with _buffered_output():
+            print(f"\n{'═' * 60}")
+            print(f"Шаг {step_counter}: {description}")
+            print(f"{'─' * 60}")
+            
+            if operation == "add" and value is not None:
+                heap_instance.add(value)
+                print(f"✓ Добавлен элемент: {value}")
+            elif operation == "remove":
+                try:
+                    removed = heap_instance.remove_min()
+                    print(f"✓ Удален элемент: {removed}")
+                except IndexError:
+                    print("✗ Куча пуста, удаление невозможно")
+            
+            # Отображаем текущее состояние кучи
+            display_heap_tree(heap_instance)
+            
+            # Показываем содержимое массива
+            print(f"\nМассив кучи: {_get_heap_data(heap_instance)}")
         step_counter += 1
         
         # Пауза для удобства восприятия
-        if step_counter < len(demonstration_sequence):
+        if not headless and step_counter < len(demonstration_sequence):
             input("\nНажмите Enter для продолжения...")
     
-    print(f"\n{'═' * 60}")
-    print("Демонстрация завершена!")
-    print(f"Итоговый размер кучи: {len(heap_instance.data)} элементов")
+    with _buffered_output():
+        print(f"\n{'═' * 60}")
+        print("Демонстрация завершена!")
+        print(f"Итоговый размер кучи: {len(_get_heap_data(heap_instance))} элементов")
 
 
 def export_heap_to_file(heap_structure, filename: str) -> None:
@@ -257,24 +325,24 @@ def export_heap_to_file(heap_structure, filename: str) -> None:
         filename: Имя файла для сохранения
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            file.write("Визуализация структуры кучи\n")
-            file.write("=" * 50 + "\n\n")
+        heap_data = _get_heap_data(heap_structure)
+        
+        # Файл пишется в двоичном режиме: дерево уже собрано в UTF-8
+        with open(filename, 'wb') as file:
+            file.write("Визуализация структуры кучи\n".encode('utf-8'))
+            file.write(b"=" * 50 + b"\n\n")
             
-            tree_representation = represent_heap_as_tree(heap_structure)
-            file.write(tree_representation)
+            # Строки дерева пишутся в файл по мере обхода, без сборки
+            # полного представления в памяти
+            if heap_data:
+                _emit_tree_lines(heap_data, 0, b"", True, file.write)
             
             # Добавляем информацию о данных
-            try:
-                heap_data = heap_structure.data
-            except AttributeError:
-                heap_data = heap_structure.heap
-            
-            file.write(f"\n\nДанные кучи (массив): {heap_data}\n")
-            file.write(f"Количество элементов: {len(heap_data)}\n")
-            
+            summary = (f"\n\nДанные кучи (массив): {heap_data}\n"
+                       f"Количество элементов: {len(heap_data)}\n")
             if heap_data:
-                file.write(f"Корневой элемент: {heap_data[0]}\n")
+                summary += f"Корневой элемент: {heap_data[0]}\n"
+            file.write(summary.encode('utf-8'))
         
         print(f"✓ Визуализация сохранена в файл: {filename}")
     except Exception as e:
@@ -283,47 +351,49 @@ def export_heap_to_file(heap_structure, filename: str) -> None:
 
 def run_visualization_examples():
     """Запуск примеров визуализации различных куч."""
-    print("\n" + "=" * 70)
-    print("ПРИМЕРЫ ВИЗУАЛИЗАЦИИ РАЗЛИЧНЫХ СТРУКТУР")
-    print("=" * 70)
-    
-    # Пример 1: Визуализация произвольного массива
-    print("\nПример 1: Визуализация массива [7, 3, 10, 1, 6, 14, 4]")
-    visualize_array_as_heap([7, 3, 10, 1, 6, 14, 4])
-    
-    # Пример 2: Построение и визуализация минимальной кучи
-    print("\n" + "=" * 70)
-    print("\nПример 2: Построение минимальной кучи из массива")
-    
-    demo_heap = create_demo_heap()
-    initial_data = [20, 15, 30, 5, 10, 25, 35]
-    
-    for value in initial_data:
-        demo_heap.add(value)
-    
-    display_heap_tree(demo_heap, "Минимальная куча после добавления всех элементов")
-    
-    # Пример 3: Визуализация после нескольких удалений
-    print("\n" + "=" * 70)
-    print("\nПример 3: Визуализация после удаления двух элементов")
-    
-    for _ in range(2):
-        try:
-            removed = demo_heap.remove_min()
-            print(f"Удален элемент: {removed}")
-        except IndexError:
-            break
-    
-    display_heap_tree(demo_heap, "Куча после удаления двух минимальных элементов")
-    
-    # Пример 4: Экспорт в файл
-    print("\n" + "=" * 70)
-    print("\nПример 4: Экспорт визуализации в файл")
-    
-    export_heap_to_file(demo_heap, "heap_visualization.txt")
-    
-    print("\n" + "=" * 70)
-    print("Все примеры выполнены успешно!")
+    # Примеры не ждут ввода, поэтому весь вывод печатается одной записью
+    with _buffered_output():
+        print("\n" + "=" * 70)
+        print("ПРИМЕРЫ ВИЗУАЛИЗАЦИИ РАЗЛИЧНЫХ СТРУКТУР")
+        print("=" * 70)
+        
+        # Пример 1: Визуализация произвольного массива
+        print("\nПример 1: Визуализация массива [7, 3, 10, 1, 6, 14, 4]")
+        visualize_array_as_heap([7, 3, 10, 1, 6, 14, 4])
+        
+        # Пример 2: Построение и визуализация минимальной кучи
+        print("\n" + "=" * 70)
+        print("\nПример 2: Построение минимальной кучи из массива")
+        
+        demo_heap = create_demo_heap()
+        initial_data = [20, 15, 30, 5, 10, 25, 35]
+        
+        for value in initial_data:
+            demo_heap.add(value)
+        
+        display_heap_tree(demo_heap, "Минимальная куча после добавления всех элементов")
+        
+        # Пример 3: Визуализация после нескольких удалений
+        print("\n" + "=" * 70)
+        print("\nПример 3: Визуализация после удаления двух элементов")
+        
+        for _ in range(2):
+            try:
+                removed = demo_heap.remove_min()
+                print(f"Удален элемент: {removed}")
+            except IndexError:
+                break
+        
+        display_heap_tree(demo_heap, "Куча после удаления двух минимальных элементов")
+        
+        # Пример 4: Экспорт в файл
+        print("\n" + "=" * 70)
+        print("\nПример 4: Экспорт визуализации в файл")
+        
+        export_heap_to_file(demo_heap, "heap_visualization.txt")
+        
+        print("\n" + "=" * 70)
+        print("Все примеры выполнены успешно!")
 
 
 def interactive_heap_visualization():
@@ -4,46 +4,139 @@ analysis.py
 Проведение замеров времени и построение графиков.
 """
 
+import os
 import time
 import random
-import matplotlib.pyplot as plt
+from functools import lru_cache
 from greedy_algorithms import interval_scheduling, fractional_knapsack
 
+# MPL_NO_SHOW=1 отключает окна с графиками (автоматические замеры, CI):
+# графики только сохраняются в файлы через неинтерактивный бэкенд Agg
+SHOW_PLOTS = not os.environ.get('MPL_NO_SHOW')
 
-def generate_intervals(n):
-    """Генерация n случайных интервалов."""
+
+def _plot_dpi(default=100):
+    """
+    Разрешение сохраняемых графиков из переменной окружения PLOT_DPI.
+    
+    100 dpi достаточно для быстрых замеров, для публикации можно задать
+    PLOT_DPI=300. Нечисловое или неположительное значение не мешает
+    импорту модуля: вместо него берется default.
+    """
+    try:
+        dpi = int(os.environ.get('PLOT_DPI', default))
+    except ValueError:
+        return default
+    return dpi if dpi > 0 else default
+
+
+PLOT_DPI = _plot_dpi()
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Зерно генератора входных данных: одинаковые входы при каждом запуске
+BENCHMARK_SEED = 42
+
+# Число повторов одного замера: среднее по нескольким вызовам сглаживает
+# дискретность таймера на малых размерах
+TIMING_REPEATS = 5
+
+
+def measure_time(func, *args, repeats=TIMING_REPEATS):
+    """
+    Среднее время одного вызова func(*args) в секундах.
+    
+    func вызывается repeats раз подряд, общее время по perf_counter_ns
+    делится на число вызовов. Сборщик мусора не отключается, а первый
+    вызов входит в среднее наравне с остальными.
+    """
+    start = time.perf_counter_ns()
+    for _ in range(repeats):
+        func(*args)
+    elapsed_ns = time.perf_counter_ns() - start
+    return elapsed_ns / repeats / 1e9
+
+
+def generate_intervals(n, seed=None):
+    """
+    Генерация n случайных интервалов.
+    
+    При наличии numpy возвращается массив формы (n, 2) с началами и
+    окончаниями, иначе - список кортежей. Если задан seed, используется
+    собственный генератор, а не глобальный.
+    """
+    if np is not None:
+        rng = np.random.RandomState(seed) if seed is not None else np.random
+        starts = rng.randint(0, 101, size=n, dtype=np.int64)
+        lengths = rng.randint(1, 21, size=n, dtype=np.int64)
+        return np.column_stack((starts, starts + lengths))
+    
+    rng = random.Random(seed) if seed is not None else random
     intervals = []
     for _ in range(n):
-        start = random.randint(0, 100)
-        end = start + random.randint(1, 20)
+        start = rng.randint(0, 100)
+        end = start + rng.randint(1, 20)
         intervals.append((start, end))
     return intervals
 
 
-def generate_knapsack_items(n):
-    """Генерация n случайных предметов для рюкзака."""
+def generate_knapsack_items(n, seed=None):
+    """
+    Генерация n случайных предметов для рюкзака.
+    
+    При наличии numpy возвращается массив формы (n, 2) с весами и
+    стоимостями, иначе - список кортежей. Если задан seed, используется
+    собственный генератор, а не глобальный.
+    """
+    if np is not None:
+        rng = np.random.RandomState(seed) if seed is not None else np.random
+        weights = rng.randint(1, 21, size=n, dtype=np.int64)
+        values = rng.randint(10, 101, size=n, dtype=np.int64)
+        return np.column_stack((weights, values))
+    
+    rng = random.Random(seed) if seed is not None else random
     items = []
     for _ in range(n):
-        weight = random.randint(1, 20)
-        value = random.randint(10, 100)
+        weight = rng.randint(1, 20)
+        value = rng.randint(10, 100)
         items.append((weight, value))
     return items
 
 
+def _freeze(data):
+    """Защита общих закэшированных входов от изменения."""
+    if np is not None and isinstance(data, np.ndarray):
+        data.setflags(write=False)
+        return data
+    return tuple(data)
+
+
+@lru_cache(maxsize=None)
+def generate_intervals_cached(n, seed=BENCHMARK_SEED):
+    """Воспроизводимые интервалы, общие для всех замеров (только для чтения)."""
+    return _freeze(generate_intervals(n, seed))
+
+
+@lru_cache(maxsize=None)
+def generate_knapsack_items_cached(n, seed=BENCHMARK_SEED):
+    """Воспроизводимые предметы, общие для всех замеров (только для чтения)."""
+    return _freeze(generate_knapsack_items(n, seed))
+
+
 def measure_interval_performance():
     """Измерение времени работы алгоритма выбора заявок."""
     sizes = [10, 50, 100, 200, 500, 1000, 2000]
     times = []
     
     for size in sizes:
-        intervals = generate_intervals(size)
+        intervals = generate_intervals_cached(size)
         
         # Замер времени
-        start_time = time.time()
-        interval_scheduling(intervals)
-        end_time = time.time()
-        
-        elapsed = end_time - start_time
+        elapsed = measure_time(interval_scheduling, intervals)
         times.append(elapsed)
         print(f"Размер данных: {size}, Время: {elapsed:.6f} сек")
     
@@ -56,23 +149,42 @@ def measure_knapsack_performance():
     times = []
     
     for size in sizes:
-        items = generate_knapsack_items(size)
+        items = generate_knapsack_items_cached(size)
         capacity = 100  # Фиксированная вместимость
         
         # Замер времени
-        start_time = time.time()
-        fractional_knapsack(capacity, items)
-        end_time = time.time()
-        
-        elapsed = end_time - start_time
+        elapsed = measure_time(fractional_knapsack, capacity, items)
         times.append(elapsed)
         print(f"Размер данных: {size}, Время: {elapsed:.6f} сек")
     
     return sizes, times
 
 
+def _pyplot():
+    """
+    Ленивый импорт matplotlib.pyplot.
+    
+    Модуль загружается только при построении графиков, поэтому импорт
+    функций замеров не тратит время на запуск matplotlib.
+    """
+    import matplotlib
+    if not SHOW_PLOTS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _save_plot(plt, filename):
+    """Сохранение текущего графика с разрешением PLOT_DPI."""
+    if PLOT_DPI >= 200:
+        plt.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
+    else:
+        plt.savefig(filename, dpi=PLOT_DPI)
+
+
 def plot_performance(sizes_interval, times_interval, sizes_knapsack, times_knapsack):
     """Построение графиков производительности."""
+    plt = _pyplot()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # График 1: Задача о выборе заявок
@@ -90,11 +202,17 @@ def plot_performance(sizes_interval, times_interval, sizes_knapsack, times_knaps
     ax2.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('performance_plots.png', dpi=300)
-    plt.show()
+    _save_plot(plt, 'performance_plots.png')
+    if SHOW_PLOTS:
+        plt.show()
 
 
 def main():
+    """
+    Полный цикл анализа: замеры и графики.
+    
+    Возвращает словарь {алгоритм: (размеры, времена)} для дальнейшей обработки.
+    """
     print("=" * 60)
     print("АНАЛИЗ ПРОИЗВОДИТЕЛЬНОСТИ ЖАДНЫХ АЛГОРИТМОВ")
     print("=" * 60)
@@ -109,6 +227,11 @@ def main():
     plot_performance(sizes_interval, times_interval, sizes_knapsack, times_knapsack)
     
     print("\nГрафики сохранены в файл 'performance_plots.png'")
+    
+    return {
+        'interval_scheduling': (sizes_interval, times_interval),
+        'fractional_knapsack': (sizes_knapsack, times_knapsack),
+    }
 
 
 if __name__ == "__main__":
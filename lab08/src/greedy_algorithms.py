@@ -5,6 +5,47 @@ greedy_algorithms.py
 2. Непрерывный рюкзак (Fractional Knapsack)
 """
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него используется сортировка списка кортежей
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba необязателен: без него проход по интервалам выполняется в Python
+    njit = None
+
+
+if njit is not None and np is not None:
+    # Явные сигнатуры (знаковые и беззнаковые концы): компиляция
+    # выполняется при импорте, а не при первом замеренном вызове
+    @njit(['int64[:](int64[:], int64[:])', 'int64[:](uint64[:], uint64[:])'], cache=True)
+    def _greedy_sweep(starts, ends):
+        """
+        Жадный проход по интервалам, отсортированным по окончанию.
+        
+        Возвращает позиции выбранных интервалов в отсортированном порядке.
+        Первый интервал выбирается всегда, поэтому сторож не нужен.
+        """
+        size = starts.shape[0]
+        chosen = np.empty(size, dtype=np.int64)
+        chosen[0] = 0
+        count = 1
+        last_end_time = ends[0]
+        
+        for position in range(1, size):
+            if starts[position] >= last_end_time:
+                chosen[count] = position
+                count += 1
+                last_end_time = ends[position]
+        
+        return chosen[:count]
+else:
+    _greedy_sweep = None
+
+
 def interval_scheduling(intervals):
     """
     Жадный алгоритм для задачи о выборе заявок.
@@ -12,28 +53,82 @@ def interval_scheduling(intervals):
     
     Args:
         intervals: список интервалов в формате [(start1, end1), (start2, end2), ...]
+                   или numpy.ndarray формы (n, 2)
     
     Returns:
         selected: список выбранных интервалов
+                  (для numpy.ndarray - массив выбранных строк)
     
     Сложность: O(n log n) из-за сортировки.
+    Если установлен numpy и концы интервалов - целые, укладывающиеся в
+    int64/uint64, сортировка выполняется одним argsort по столбцу
+    окончаний, без вызова lambda для каждого интервала. Дробные концы и
+    длинные целые обрабатываются сортировкой списка без преобразований.
     """
-    if not intervals:
-        return []
+    is_array = np is not None and isinstance(intervals, np.ndarray)
+    if len(intervals) == 0:
+        return intervals[:0] if is_array else []
+    
+    if np is not None:
+        arr = np.asarray(intervals)
+        if arr.dtype.kind in 'iu':
+            return _interval_scheduling_numpy(intervals, arr.reshape(-1, 2))
     
     # Сортируем интервалы по времени окончания
     sorted_intervals = sorted(intervals, key=lambda x: x[1])
     
-    selected = []
-    last_end_time = -float('inf')
+    # Выбранных интервалов не больше, чем всех: список выделяется сразу
+    selected = [None] * len(sorted_intervals)
+    count = 0
+    # Первый интервал выбирается всегда: его начало служит сторожем
+    # того же типа, что и концы интервалов
+    last_end_time = sorted_intervals[0][0]
     
     for interval in sorted_intervals:
         start, end = interval
         if start >= last_end_time:
-            selected.append(interval)
+            selected[count] = interval
+            count += 1
             last_end_time = end
     
-    return selected
+    if is_array:
+        return np.array(selected[:count], dtype=intervals.dtype).reshape(-1, 2)
+    return selected[:count]
+
+
+def _interval_scheduling_numpy(intervals, arr):
+    """
+    Выбор заявок по столбцам numpy-массива (начала и окончания отдельно).
+    
+    arr - intervals в виде целочисленного массива формы (n, 2); его тип
+    не меняется, поэтому значения не усекаются и не переполняются.
+    """
+    # Устойчивая сортировка сохраняет порядок интервалов с равным окончанием
+    order = np.argsort(arr[:, 1], kind='stable')
+    
+    if _greedy_sweep is not None:
+        # Приведение к 64 битам того же знака значения не меняет
+        wide = np.uint64 if arr.dtype.kind == 'u' else np.int64
+        chosen = _greedy_sweep(arr[order, 0].astype(wide), arr[order, 1].astype(wide))
+    else:
+        starts = arr[order, 0].tolist()
+        ends = arr[order, 1].tolist()
+        
+        chosen = [0] * len(starts)
+        count = 0
+        last_end_time = starts[0]  # Первый интервал выбирается всегда
+        
+        for position, start in enumerate(starts):
+            if start >= last_end_time:
+                chosen[count] = position
+                count += 1
+                last_end_time = ends[position]
+        del chosen[count:]
+    
+    selected_rows = order[chosen]
+    if isinstance(intervals, np.ndarray):
+        return intervals[selected_rows]
+    return [intervals[row] for row in selected_rows.tolist()]
 
 
 def fractional_knapsack(capacity, items):
@@ -50,10 +145,15 @@ def fractional_knapsack(capacity, items):
         knapsack_items: список взятых предметов (вес, стоимость)
     
     Сложность: O(n log n) из-за сортировки по удельной стоимости.
+    Если установлен numpy, сортировка и заполнение рюкзака выполняются
+    векторно: argsort по удельной стоимости и cumsum по весам.
     """
-    if capacity <= 0 or not items:
+    if capacity <= 0 or len(items) == 0:
         return 0.0, []
     
+    if np is not None:
+        return _fractional_knapsack_numpy(capacity, items)
+    
     # Рассчитываем удельную стоимость для каждого предмета
     items_with_ratio = []
     for weight, value in items:
@@ -65,7 +165,8 @@ def fractional_knapsack(capacity, items):
     items_with_ratio.sort(key=lambda x: x[2], reverse=True)
     
     total_value = 0.0
-    knapsack_items = []
+    knapsack_items = [None] * len(items_with_ratio)
+    count = 0
     remaining_capacity = capacity
     
     for weight, value, ratio in items_with_ratio:
@@ -84,7 +185,41 @@ def fractional_knapsack(capacity, items):
             remaining_capacity = 0
         
         total_value += taken_value
-        knapsack_items.append((taken_weight, taken_value))
+        knapsack_items[count] = (taken_weight, taken_value)
+        count += 1
+    
+    return total_value, knapsack_items[:count]
+
+
+def _fractional_knapsack_numpy(capacity, items):
+    """Непрерывный рюкзак на numpy: целые предметы отсекаются по cumsum весов."""
+    arr = np.asarray(items, dtype=np.float64).reshape(-1, 2)
+    
+    # Предметы с нулевым весом пропускаются, как и в основной версии
+    positive = np.flatnonzero(arr[:, 0] > 0)
+    ratios = arr[positive, 1] / arr[positive, 0]
+    
+    # Устойчивая сортировка по убыванию удельной стоимости
+    order = positive[np.argsort(-ratios, kind='stable')]
+    weights = arr[order, 0]
+    values = arr[order, 1]
+    
+    # Целиком берутся предметы, суммарный вес которых не превышает вместимость
+    cumulative_weights = np.cumsum(weights)
+    cutoff = int(np.searchsorted(cumulative_weights, capacity, side='right'))
+    
+    total_value = float(values[:cutoff].sum())
+    # Целые предметы возвращаются в исходном виде (вес, стоимость)
+    knapsack_items = [(weight, value) for weight, value in
+                      (items[index] for index in order[:cutoff].tolist())]
+    
+    remaining_capacity = capacity - sum(weight for weight, _ in knapsack_items)
+    if cutoff < len(order) and remaining_capacity > 0:
+        # Берем часть следующего предмета
+        weight, value = items[order[cutoff]]
+        taken_value = value * (remaining_capacity / weight)
+        total_value += taken_value
+        knapsack_items.append((remaining_capacity, taken_value))
     
     return total_value, knapsack_items
 
@@ -4,11 +4,49 @@ comparison.py
 Проведение замеров времени и построение графиков.
 """
 
+import os
 import time
 import random
-import matplotlib.pyplot as plt
 from dynamic_programming import fibonacci_bottom_up, fibonacci_optimized, knapsack_01_bottom_up
 
+# MPL_NO_SHOW=1: графики только сохраняются в файлы
+SHOW_PLOTS = not os.environ.get('MPL_NO_SHOW')
+
+
+def _plot_dpi(default=100):
+    """PLOT_DPI из окружения; при ошибке в значении - default."""
+    try:
+        dpi = int(os.environ.get('PLOT_DPI', default))
+    except ValueError:
+        return default
+    return dpi if dpi > 0 else default
+
+
+PLOT_DPI = _plot_dpi()
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Число вызовов, по которым усредняется один замер
+TIMING_REPEATS = 5
+
+
+def measure_time(func, *args, repeats=TIMING_REPEATS):
+    """
+    Среднее по repeats вызовам время func(*args) в секундах.
+    
+    Все вызовы получают одни и те же аргументы, поэтому замеряемая
+    функция не должна их изменять (функции ДП их только читают).
+    """
+    start = time.perf_counter_ns()
+    for _ in range(repeats):
+        func(*args)
+    elapsed_ns = time.perf_counter_ns() - start
+    return elapsed_ns / repeats / 1e9
+
 
 def measure_fibonacci_performance():
     """Измерение времени работы алгоритмов Фибоначчи."""
@@ -22,14 +60,10 @@ def measure_fibonacci_performance():
     
     for n in sizes:
         # Замер для bottom-up подхода
-        start = time.time()
-        fibonacci_bottom_up(n)
-        time_bu = time.time() - start
+        time_bu = measure_time(fibonacci_bottom_up, n)
         
         # Замер для оптимизированной версии
-        start = time.time()
-        fibonacci_optimized(n)
-        time_opt = time.time() - start
+        time_opt = measure_time(fibonacci_optimized, n)
         
         times_bottom_up.append(time_bu)
         times_optimized.append(time_opt)
@@ -51,14 +85,17 @@ def measure_knapsack_performance():
     print("-" * 40)
     
     for n in sizes:
-        # Генерируем случайные предметы
-        values = [random.randint(10, 100) for _ in range(n)]
-        weights = [random.randint(1, 30) for _ in range(n)]
+        # Генерируем случайные предметы. Целочисленные массивы numpy
+        # передаются как есть: строку ДП обновляют numpy или numba
+        if np is not None:
+            values = np.random.randint(10, 101, size=n)
+            weights = np.random.randint(1, 31, size=n)
+        else:
+            values = [random.randint(10, 100) for _ in range(n)]
+            weights = [random.randint(1, 30) for _ in range(n)]
         
         # Замер времени
-        start = time.time()
-        knapsack_01_bottom_up(values, weights, capacity)
-        elapsed = time.time() - start
+        elapsed = measure_time(knapsack_01_bottom_up, values, weights, capacity)
         
         times.append(elapsed)
         print(f"{n}\t\t{elapsed:.6f}")
@@ -66,12 +103,30 @@ def measure_knapsack_performance():
     return sizes, times
 
 
+def _pyplot():
+    """Импорт matplotlib.pyplot при первом построении графика."""
+    import matplotlib
+    if not SHOW_PLOTS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _save_plot(plt, filename):
+    """Сохранение текущего графика с разрешением PLOT_DPI."""
+    if PLOT_DPI >= 200:
+        plt.savefig(filename, dpi=PLOT_DPI, bbox_inches='tight')
+    else:
+        plt.savefig(filename, dpi=PLOT_DPI)
+
+
 def plot_fibonacci_performance(sizes, times_bu, times_opt):
     """Построение графиков для алгоритмов Фибоначчи."""
+    plt = _pyplot()
     plt.figure(figsize=(10, 5))
     
     plt.plot(sizes, times_bu, 'bo-', linewidth=2, markersize=6, label='Bottom-Up (O(n) память)')
-    plt.plot(sizes, times_opt, 'ro-', linewidth=2, markersize=6, label='Optimized (O(1) память)')
+    plt.plot(sizes, times_opt, 'ro-', linewidth=2, markersize=6, label='Optimized (быстрое удвоение, O(log n))')
     
     plt.title('Сравнение алгоритмов вычисления чисел Фибоначчи')
     plt.xlabel('n (номер числа Фибоначчи)')
@@ -79,12 +134,14 @@ def plot_fibonacci_performance(sizes, times_bu, times_opt):
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('fibonacci_performance.png', dpi=300)
-    plt.show()
+    _save_plot(plt, 'fibonacci_performance.png')
+    if SHOW_PLOTS:
+        plt.show()
 
 
 def plot_knapsack_performance(sizes, times):
     """Построение графиков для задачи о рюкзаке."""
+    plt = _pyplot()
     plt.figure(figsize=(10, 5))
     
     plt.plot(sizes, times, 'go-', linewidth=2, markersize=6)
@@ -94,12 +151,14 @@ def plot_knapsack_performance(sizes, times):
     plt.ylabel('Время выполнения (сек)')
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig('knapsack_performance.png', dpi=300)
-    plt.show()
+    _save_plot(plt, 'knapsack_performance.png')
+    if SHOW_PLOTS:
+        plt.show()
 
 
 def plot_comparison_chart():
     """Создание общего графика сравнения."""
+    plt = _pyplot()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
     # Данные для демонстрации
@@ -128,11 +187,17 @@ def plot_comparison_chart():
     ax2.legend()
     
     plt.tight_layout()
-    plt.savefig('dp_comparison.png', dpi=300)
-    plt.show()
+    _save_plot(plt, 'dp_comparison.png')
+    if SHOW_PLOTS:
+        plt.show()
 
 
 def main():
+    """
+    Полный цикл анализа: замеры и графики.
+    
+    Возвращает словарь {алгоритм: (размеры, времена)} для дальнейшей обработки.
+    """
     print("=" * 60)
     print("СРАВНИТЕЛЬНЫЙ АНАЛИЗ АЛГОРИТМОВ ДИНАМИЧЕСКОГО ПРОГРАММИРОВАНИЯ")
     print("=" * 60)
@@ -156,6 +221,12 @@ def main():
     print("\n" + "=" * 60)
     print("Анализ завершен!")
     print("=" * 60)
+    
+    return {
+        'fibonacci_bottom_up': (sizes_fib, times_bu),
+        'fibonacci_optimized': (sizes_fib, times_opt),
+        'knapsack_01_bottom_up': (sizes_knap, times_knap),
+    }
 
 
 if __name__ == "__main__":
@@ -5,6 +5,43 @@ dynamic_programming.py
 2. Задача о рюкзаке 0-1 (восходящий подход)
 """
 
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него таблица ДП заполняется в цикле Python
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba необязателен: без него строка ДП обновляется средствами numpy
+    njit = None
+
+
+if njit is not None and np is not None:
+    # Явная сигнатура: компиляция выполняется при импорте, а с cache=True
+    # ее результат берется из __pycache__ при следующих запусках
+    @njit('int64[::1](int64[:], int64[:], int64)', cache=True)
+    def _knapsack_kernel(values, weights, capacity):
+        """Строка ДП рюкзака 0-1 с обходом вместимостей справа налево."""
+        dp = np.zeros(capacity + 1, dtype=np.int64)
+        
+        for i in range(values.shape[0]):
+            weight = weights[i]
+            value = values[i]
+            low = max(weight, 1)
+            for w in range(capacity, low - 1, -1):
+                candidate = dp[w - weight] + value
+                if candidate > dp[w]:
+                    dp[w] = candidate
+        
+        return dp
+else:
+    _knapsack_kernel = None
+
+
 def fibonacci_bottom_up(n):
     """
     Вычисление n-го числа Фибоначчи с использованием восходящего ДП.
@@ -36,7 +73,9 @@ def fibonacci_bottom_up(n):
 def fibonacci_optimized(n):
     """
     Оптимизированная версия вычисления чисел Фибоначчи.
-    Использует O(1) памяти.
+    Использует метод быстрого удвоения:
+        F(2k) = F(k) * (2 * F(k + 1) - F(k))
+        F(2k + 1) = F(k)^2 + F(k + 1)^2
     
     Args:
         n: номер числа Фибоначчи
@@ -45,17 +84,94 @@ def fibonacci_optimized(n):
         n-е число Фибоначчи
     
     Сложность:
-        Время: O(n)
+        Время: O(log n) шагов (каждый - умножение длинных чисел)
         Память: O(1)
     """
     if n <= 1:
         return n
     
-    prev, curr = 0, 1
-    for _ in range(2, n + 1):
-        prev, curr = curr, prev + curr
+    return _fib_fast_doubling(n)
+
+
+@lru_cache(maxsize=None)
+def fibonacci_cached(n):
+    """
+    Вычисление n-го числа Фибоначчи с запоминанием результатов.
+    
+    Предназначена для многократных запросов (например, по диапазону n):
+    повторный запрос того же n обслуживается из кэша за O(1). Сами
+    fibonacci_bottom_up и fibonacci_optimized не кэшируются, чтобы
+    замеры в comparison.py отражали стоимость вычисления.
+    
+    Args:
+        n: номер числа Фибоначчи
+    
+    Returns:
+        n-е число Фибоначчи
+    """
+    return fibonacci_optimized(n)
+
+
+def _fib_fast_doubling(n):
+    """F(n) быстрым удвоением по битам n от старшего к младшему."""
+    # Инвариант: a = F(k), b = F(k + 1) для прочитанного префикса битов k
+    a, b = 0, 1
+    for bit in range(n.bit_length() - 1, -1, -1):
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k + 1)
+        if (n >> bit) & 1:
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
+def _int64_values(values):
+    """
+    Стоимости в виде массива int64 или None, если так считать нельзя.
+    
+    Массив возвращается только для целых стоимостей, у которых сумма
+    модулей меньше 2**63: тогда ни одна ячейка таблицы ДП не переполнит
+    int64. Дробные, длинные целые и прочие стоимости обрабатываются
+    циклами Python.
+    """
+    value_array = np.asarray(values)
+    if value_array.dtype.kind not in 'iu':
+        return None
+    if sum(abs(value) for value in value_array.tolist()) >= 1 << 63:
+        return None
+    return value_array.astype(np.int64)
+
+
+def _int64_weights(weights, n):
+    """
+    Веса в виде массива int64 или None, если так считать нельзя.
     
-    return curr
+    Ядро numba и векторные строки numpy индексируют dp[w - weight] без
+    проверок, поэтому массив возвращается только для n целых
+    неотрицательных весов. Дробные и отрицательные веса, а также список
+    другой длины обрабатываются циклами Python, которые сообщают об
+    ошибке так же, как и без numpy.
+    """
+    weight_array = np.asarray(weights)
+    if weight_array.ndim != 1 or len(weight_array) != n:
+        return None
+    if weight_array.dtype.kind not in 'iu':
+        return None
+    if n and (weight_array.min() < 0 or weight_array.max() >= 1 << 63):
+        return None
+    return weight_array.astype(np.int64)
+
+
+def _int64_items(values, weights):
+    """Пара массивов int64 (стоимости, веса) для numpy и numba или None."""
+    if np is None:
+        return None
+    value_array = _int64_values(values)
+    weight_array = _int64_weights(weights, len(values))
+    if value_array is None or weight_array is None:
+        return None
+    return value_array, weight_array
 
 
 def knapsack_01_bottom_up(values, weights, capacity):
@@ -72,32 +188,41 @@ def knapsack_01_bottom_up(values, weights, capacity):
     
     Сложность:
         Время: O(n * capacity), где n - количество предметов
-        Память: O(n * capacity)
+        Память: O(capacity)
+    
+    Хранится одна строка таблицы, которая обновляется справа налево:
+    при таком порядке ячейка dp[w - weight] еще содержит значение для
+    предыдущих предметов, поэтому каждый предмет берется не более раза.
+    Если установлен numpy, а стоимости и веса - целые, помещающиеся в
+    int64, строка обновляется одной векторной операцией.
     """
     n = len(values)
     if n == 0 or capacity == 0:
         return 0
     
-    # Создаем 2D таблицу для хранения результатов
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+    items = _int64_items(values, weights)
+    if items is not None:
+        # Целые данные без риска переполнения: компилированный цикл numba
+        # или векторная строка numpy
+        if _knapsack_kernel is not None:
+            row = _knapsack_kernel(items[0], items[1], capacity)
+        else:
+            row = _knapsack_row_numpy(items[0], items[1], capacity)
+        return row[capacity].item()
     
-    # Заполняем таблицу
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            # Если предмет i можно взять (его вес <= текущей вместимости)
-            if weights[i - 1] <= w:
-                # Максимум из двух вариантов:
-                # 1. Не брать предмет i
-                # 2. Брать предмет i + оптимальное решение для оставшейся вместимости
-                dp[i][w] = max(
-                    dp[i - 1][w],  # не берем предмет
-                    dp[i - 1][w - weights[i - 1]] + values[i - 1]  # берем предмет
-                )
-            else:
-                # Предмет слишком тяжелый, не берем его
-                dp[i][w] = dp[i - 1][w]
-    
-    return dp[n][capacity]
+    # Одна строка таблицы: dp[w] - лучшая стоимость при вместимости w
+    dp = [0] * (capacity + 1)
+    
+    for i in range(n):
+        weight = weights[i]
+        value = values[i]
+        # Обходим вместимости, в которые предмет помещается, справа налево.
+        # Столбец w = 0 не меняется, как и в двумерной таблице
+        for w in range(capacity, max(weight, 1) - 1, -1):
+            # Максимум из двух вариантов: не брать предмет или взять его
+            dp[w] = max(dp[w], dp[w - weight] + value)
+    
+    return dp[capacity]
 
 
 def knapsack_01_with_reconstruction(values, weights, capacity):
@@ -117,19 +242,24 @@ def knapsack_01_with_reconstruction(values, weights, capacity):
     if n == 0 or capacity == 0:
         return 0, []
     
-    # Создаем таблицу
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-    
-    # Заполняем таблицу
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            if weights[i - 1] <= w:
-                dp[i][w] = max(
-                    dp[i - 1][w],
-                    dp[i - 1][w - weights[i - 1]] + values[i - 1]
-                )
-            else:
-                dp[i][w] = dp[i - 1][w]
+    items = _int64_items(values, weights)
+    if items is not None:
+        # Строки numpy-таблицы переводятся в списки для восстановления
+        dp = _knapsack_table_numpy(items[0], items[1], capacity).tolist()
+    else:
+        # Создаем таблицу
+        dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+        
+        # Заполняем таблицу
+        for i in range(1, n + 1):
+            for w in range(1, capacity + 1):
+                if weights[i - 1] <= w:
+                    dp[i][w] = max(
+                        dp[i - 1][w],
+                        dp[i - 1][w - weights[i - 1]] + values[i - 1]
+                    )
+                else:
+                    dp[i][w] = dp[i - 1][w]
     
     # Восстанавливаем решение
     selected_items = []
@@ -143,6 +273,52 @@ def knapsack_01_with_reconstruction(values, weights, capacity):
     return dp[n][capacity], selected_items
 
 
+def _knapsack_table_numpy(value_array, weight_array, capacity):
+    """
+    Таблица ДП рюкзака 0-1 размера (n + 1) x (capacity + 1) на numpy.
+    
+    Строка i получается из строки i - 1 одним np.maximum: для вместимостей
+    w >= max(weight, 1) сравниваются варианты «не брать» и «брать» предмет,
+    остальные ячейки копируются. Столбец w = 0 остается нулевым, как и в
+    версии с циклами. Стоимости и веса передаются массивами int64 из
+    _int64_items.
+    """
+    n = len(value_array)
+    dp = np.zeros((n + 1, capacity + 1), dtype=np.int64)
+    
+    for i in range(1, n + 1):
+        weight = int(weight_array[i - 1])
+        low = max(weight, 1)
+        previous = dp[i - 1]
+        dp[i, :low] = previous[:low]
+        if low <= capacity:
+            np.maximum(previous[low:],
+                       previous[low - weight:capacity + 1 - weight] + value_array[i - 1],
+                       out=dp[i, low:])
+    
+    return dp
+
+
+def _knapsack_row_numpy(value_array, weight_array, capacity):
+    """
+    Итоговая строка ДП рюкзака 0-1 (capacity + 1 ячеек) на numpy.
+    
+    Правая часть np.maximum вычисляется во временный массив до записи,
+    поэтому все предметы учитываются по значениям предыдущей строки.
+    Стоимости и веса передаются массивами int64 из _int64_items.
+    """
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    
+    for i in range(len(value_array)):
+        weight = int(weight_array[i])
+        low = max(weight, 1)
+        if low <= capacity:
+            np.maximum(dp[low:], dp[low - weight:capacity + 1 - weight] + value_array[i],
+                       out=dp[low:])
+    
+    return dp
+
+
 def print_dp_table(dp):
     """Вспомогательная функция для вывода таблицы ДП."""
     for row in dp:
@@ -0,0 +1,86 @@
+"""
+Тесты задачи о рюкзаке 0-1: ветки numpy/numba должны давать тот же
+результат (или ту же ошибку), что и циклы Python.
+"""
+
+import random
+import unittest
+
+import dynamic_programming as dp
+
+
+def _reference_knapsack(values, weights, capacity):
+    """Эталон: полный перебор подмножеств предметов."""
+    best = 0
+    n = len(values)
+    for mask in range(1 << n):
+        weight = sum(weights[i] for i in range(n) if mask >> i & 1)
+        if weight <= capacity:
+            best = max(best, sum(values[i] for i in range(n) if mask >> i & 1))
+    return best
+
+
+class TestKnapsackBottomUp(unittest.TestCase):
+    """Проверка knapsack_01_bottom_up."""
+
+    def test_random_against_brute_force(self):
+        """Случайные целые данные сверяются с полным перебором."""
+        rng = random.Random(0)
+        for _ in range(200):
+            n = rng.randint(0, 8)
+            capacity = rng.randint(0, 30)
+            values = [rng.randint(0, 50) for _ in range(n)]
+            weights = [rng.randint(1, 15) for _ in range(n)]
+            self.assertEqual(dp.knapsack_01_bottom_up(values, weights, capacity),
+                             _reference_knapsack(values, weights, capacity))
+
+    def test_values_beyond_int64(self):
+        """Сумма стоимостей больше 2**63 не переполняется."""
+        self.assertEqual(dp.knapsack_01_bottom_up([2**62, 2**62], [1, 1], 2), 2**63)
+
+    def test_fractional_weights_rejected(self):
+        """Дробные веса не усекаются до целых."""
+        with self.assertRaises(TypeError):
+            dp.knapsack_01_bottom_up([10, 10], [1.5, 1.5], 2)
+
+    def test_negative_weight_rejected(self):
+        """Отрицательный вес не читает память за пределами строки ДП."""
+        with self.assertRaises(IndexError):
+            dp.knapsack_01_bottom_up([10, 10], [-1, 1], 2)
+
+    def test_short_weights_rejected(self):
+        """Весов меньше, чем стоимостей."""
+        with self.assertRaises(IndexError):
+            dp.knapsack_01_bottom_up([10, 10], [1], 2)
+
+
+
+class TestKnapsackReconstruction(unittest.TestCase):
+    """Проверка knapsack_01_with_reconstruction."""
+
+    def test_random_against_brute_force(self):
+        """Стоимость совпадает с перебором, а выбранные предметы ее дают."""
+        rng = random.Random(1)
+        for _ in range(200):
+            n = rng.randint(0, 8)
+            capacity = rng.randint(0, 30)
+            values = [rng.randint(0, 50) for _ in range(n)]
+            weights = [rng.randint(1, 15) for _ in range(n)]
+            best, selected = dp.knapsack_01_with_reconstruction(values, weights, capacity)
+            self.assertEqual(best, _reference_knapsack(values, weights, capacity))
+            self.assertEqual(sum(values[i] for i in selected), best)
+            self.assertLessEqual(sum(weights[i] for i in selected), capacity)
+
+    def test_fractional_weights_rejected(self):
+        """Таблица и восстановление используют одни и те же веса."""
+        with self.assertRaises(TypeError):
+            dp.knapsack_01_with_reconstruction([10, 10], [1.5, 1.5], 2)
+
+    def test_short_weights_rejected(self):
+        """Весов меньше, чем стоимостей."""
+        with self.assertRaises(IndexError):
+            dp.knapsack_01_with_reconstruction([10, 10], [1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
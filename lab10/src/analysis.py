@@ -4,12 +4,41 @@ analysis.py
 Построение графиков.
 """
 
+import gc
 import time
 import random
 import matplotlib.pyplot as plt
 from graph_representation import AdjacencyMatrix, AdjacencyList
 from graph_traversal import bfs, dfs_iterative, bfs_shortest_path  # Добавили импорт
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Перемещения по лабиринту: вверх, вниз, влево, вправо
+MAZE_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def measure_time(func, *args):
+    """
+    Время единственного вызова func(*args) в секундах (по perf_counter_ns).
+    
+    Повторов нет, поэтому на малых графах точность ограничена
+    разрешением таймера. На время вызова сборщик мусора отключается,
+    чтобы его проход не попал в замер.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        func(*args)
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed_ns * 1e-9
+
 
 def generate_random_graph(vertices, edges, directed=False):
     """
@@ -26,8 +55,11 @@ def generate_random_graph(vertices, edges, directed=False):
     matrix = AdjacencyMatrix(vertices, directed)
     adj_list = AdjacencyList(vertices, directed)
     
-    # Генерация случайных ребер
     added_edges = 0
+    if np is not None and edges > 0:
+        added_edges = _add_random_edges_numpy(matrix, adj_list, vertices, edges, directed)
+    
+    # Генерация случайных ребер (и добор, если кандидатов не хватило)
     while added_edges < edges:
         u = random.randint(0, vertices - 1)
         v = random.randint(0, vertices - 1)
@@ -40,6 +72,64 @@ def generate_random_graph(vertices, edges, directed=False):
     return matrix, adj_list
 
 
+def _add_random_edges_numpy(matrix, adj_list, vertices, edges, directed):
+    """
+    Пакетное добавление случайных ребер с помощью NumPy.
+    
+    Генерируется 3·edges пар-кандидатов, петли отбрасываются, повторы
+    удаляются через np.unique по ключу u*V+v (для неориентированного
+    графа пара упорядочивается, чтобы (u, v) и (v, u) совпадали).
+    
+    Returns:
+        Количество добавленных ребер (не больше edges)
+    """
+    candidates = np.random.randint(0, vertices, size=(3 * edges, 2)).astype(np.int64)
+    candidates = candidates[candidates[:, 0] != candidates[:, 1]]
+    if directed:
+        keys = candidates[:, 0] * vertices + candidates[:, 1]
+    else:
+        keys = candidates.min(axis=1) * vertices + candidates.max(axis=1)
+    
+    # Первые вхождения в исходном (случайном) порядке
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    chosen = candidates[first[:edges]]
+    weights = np.random.randint(1, 11, size=len(chosen))
+    
+    u, v = chosen[:, 0], chosen[:, 1]
+    matrix.matrix[u, v] = weights
+    if not directed:
+        matrix.matrix[v, u] = weights
+    
+    add_edge = adj_list.add_edge
+    for a, b, weight in zip(u.tolist(), v.tolist(), weights.tolist()):
+        add_edge(a, b, weight)
+    
+    return len(chosen)
+
+
+def _fill_random_edges(graph_class, vertices, edges):
+    """
+    Создание графа graph_class на vertices вершинах и добавление edges
+    случайных ребер (петли пропускаются).
+    
+    Граф создается внутри замера: выделение O(V²) памяти под матрицу
+    смежности - часть стоимости этого представления.
+    """
+    graph = graph_class(vertices)
+    for _ in range(edges):
+        u = random.randint(0, vertices - 1)
+        v = random.randint(0, vertices - 1)
+        if u != v:
+            graph.add_edge(u, v)
+
+
+def _get_all_neighbors(graph, vertices):
+    """Получение списков соседей для всех вершин графа."""
+    for v in range(vertices):
+        graph.get_neighbors(v)
+
+
 def measure_add_edge_performance():
     """
     Измерение времени добавления ребер для разных представлений.
@@ -60,25 +150,9 @@ def measure_add_edge_performance():
     for vertices in sizes:
         edges = vertices * 2  # Плотность графа
         
-        # Тест для матрицы смежности
-        start = time.time()
-        matrix = AdjacencyMatrix(vertices)
-        for _ in range(edges):
-            u = random.randint(0, vertices - 1)
-            v = random.randint(0, vertices - 1)
-            if u != v:
-                matrix.add_edge(u, v)
-        time_matrix = time.time() - start
-        
-        # Тест для списка смежности
-        start = time.time()
-        adj_list = AdjacencyList(vertices)
-        for _ in range(edges):
-            u = random.randint(0, vertices - 1)
-            v = random.randint(0, vertices - 1)
-            if u != v:
-                adj_list.add_edge(u, v)
-        time_list = time.time() - start
+        # Тест для матрицы смежности и для списка смежности
+        time_matrix = measure_time(_fill_random_edges, AdjacencyMatrix, vertices, edges)
+        time_list = measure_time(_fill_random_edges, AdjacencyList, vertices, edges)
         
         times_matrix.append(time_matrix)
         times_list.append(time_list)
@@ -105,17 +179,9 @@ def measure_neighbors_performance():
     for edges in edges_list:
         matrix, adj_list = generate_random_graph(vertices, edges)
         
-        # Тест для матрицы смежности
-        start = time.time()
-        for v in range(vertices):
-            matrix.get_neighbors(v)
-        time_matrix = time.time() - start
-        
-        # Тест для списка смежности
-        start = time.time()
-        for v in range(vertices):
-            adj_list.get_neighbors(v)
-        time_list = time.time() - start
+        # Тест для матрицы смежности и для списка смежности
+        time_matrix = measure_time(_get_all_neighbors, matrix, vertices)
+        time_list = measure_time(_get_all_neighbors, adj_list, vertices)
         
         times_matrix.append(time_matrix)
         times_list.append(time_list)
@@ -142,15 +208,9 @@ def measure_traversal_performance():
         edges = vertices * 2
         _, adj_list = generate_random_graph(vertices, edges)
         
-        # Тест BFS
-        start = time.time()
-        bfs(adj_list, 0)
-        time_bfs = time.time() - start
-        
-        # Тест DFS
-        start = time.time()
-        dfs_iterative(adj_list, 0)
-        time_dfs = time.time() - start
+        # Тест BFS и DFS
+        time_bfs = measure_time(bfs, adj_list, 0)
+        time_dfs = measure_time(dfs_iterative, adj_list, 0)
         
         times_bfs.append(time_bfs)
         times_dfs.append(time_dfs)
@@ -228,6 +288,63 @@ def plot_performance_comparison():
     plt.show()
 
 
+def build_maze_graph(maze):
+    """
+    Преобразование лабиринта (0 - проход, 1 - стена) в неориентированный граф.
+    
+    Вершина клетки (r, c) имеет номер r * cols + c. Из каждой проходимой
+    клетки добавляются ребра в соседние проходимые клетки в порядке
+    MAZE_DIRECTIONS, поэтому каждое ребро встречается в обоих направлениях.
+    
+    Если установлен numpy, допустимые переходы находятся сдвигами маски
+    проходимых клеток, а списки смежности заполняются сразу целиком в
+    том же порядке, что и при поочередных вызовах add_edge.
+    """
+    rows = len(maze)
+    cols = len(maze[0])
+    graph = AdjacencyList(rows * cols, directed=False, weighted=False)
+    
+    if np is None:
+        for r in range(rows):
+            for c in range(cols):
+                if maze[r][c] == 0:  # Только из проходимых клеток
+                    for dr, dc in MAZE_DIRECTIONS:
+                        nr, nc = r + dr, c + dc
+                        if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0:
+                            graph.add_edge(r * cols + c, nr * cols + nc)
+        return graph
+    
+    passable = np.asarray(maze) == 0
+    cell_ids = np.arange(rows * cols).reshape(rows, cols)
+    sources, targets, call_order = [], [], []
+    
+    for direction, (dr, dc) in enumerate(MAZE_DIRECTIONS):
+        # Клетки, у которых сосед в этом направлении внутри лабиринта
+        src = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), cols - max(0, dc)))
+        dst = (slice(max(0, dr), rows - max(0, -dr)), slice(max(0, dc), cols - max(0, -dc)))
+        mask = passable[src] & passable[dst]
+        u = cell_ids[src][mask]
+        sources.append(u)
+        targets.append(cell_ids[dst][mask])
+        # Номер вызова add_edge при обходе клеток построчно
+        call_order.append(u * len(MAZE_DIRECTIONS) + direction)
+    
+    u = np.concatenate(sources)
+    v = np.concatenate(targets)
+    order = np.concatenate(call_order)
+    
+    # Каждый вызов add_edge(u, v) дописывает v к списку u, затем u к списку v
+    owners = np.concatenate((u, v))
+    others = np.concatenate((v, u))
+    sequence = np.concatenate((2 * order, 2 * order + 1))
+    ranked = np.lexsort((sequence, owners))
+    
+    counts = np.bincount(owners, minlength=rows * cols)
+    groups = np.split(others[ranked], np.cumsum(counts)[:-1])
+    graph.neighbors = graph.adj_list = [group.tolist() for group in groups]
+    return graph
+
+
 def practical_task():
     """
     Практическая задача: Поиск кратчайшего пути в лабиринте.
@@ -253,26 +370,12 @@ def practical_task():
     cols = len(maze[0])
     
     # Преобразование лабиринта в граф
-    vertices = rows * cols
-    graph = AdjacencyList(vertices, directed=False)
+    graph = build_maze_graph(maze)
     
     # Функция для преобразования координат в номер вершины
     def cell_to_vertex(row, col):
         return row * cols + col
     
-    # Добавление ребер (перемещения в соседние клетки)
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Вверх, вниз, влево, вправо
-    
-    for r in range(rows):
-        for c in range(cols):
-            if maze[r][c] == 0:  # Только из проходимых клеток
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0:
-                        u = cell_to_vertex(r, c)
-                        v = cell_to_vertex(nr, nc)
-                        graph.add_edge(u, v)
-    
     print(f"Лабиринт {rows}x{cols}:")
     for row in maze:
         print(" ".join("██" if cell == 1 else "  " for cell in row))
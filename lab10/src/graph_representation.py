@@ -5,6 +5,25 @@ graph_representation.py
 2. Список смежности (Adjacency List)
 """
 
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него матрица хранится списком списков
+    np = None
+
+# Диапазон весов, которые хранятся в матрице int32 без потерь
+INT32_MIN, INT32_MAX = -(1 << 31), (1 << 31) - 1
+
+
+def _fits_int32(weight):
+    """Проверка, что вес - целое число из диапазона int32."""
+    return (isinstance(weight, (int, np.integer))
+            and INT32_MIN <= weight <= INT32_MAX)
+
+
 class AdjacencyMatrix:
     """
     Представление графа в виде матрицы смежности.
@@ -13,6 +32,12 @@ class AdjacencyMatrix:
     - Память: O(V²)
     - Проверка наличия ребра: O(1)
     - Получение соседей вершины: O(V)
+    
+    Если установлен numpy, матрица хранится массивом int32: 4 байта на
+    ячейку вместо объекта int и указателя, а поиск соседей выполняется
+    векторно. Первый вес, который не помещается в int32 (дробный или
+    большой по модулю), переводит матрицу в массив объектов Python, и
+    дальше веса хранятся точно, как в списке списков.
     """
     
     def __init__(self, vertices=0, directed=False):
@@ -25,7 +50,10 @@ class AdjacencyMatrix:
         """
         self.directed = directed
         self.vertices = vertices
-        self.matrix = [[0] * vertices for _ in range(vertices)]
+        if np is not None:
+            self.matrix = np.zeros((vertices, vertices), dtype=np.int32)
+        else:
+            self.matrix = [[0] * vertices for _ in range(vertices)]
     
     def add_edge(self, u, v, weight=1):
         """
@@ -39,6 +67,10 @@ class AdjacencyMatrix:
             weight: вес ребра (по умолчанию 1)
         """
         if 0 <= u < self.vertices and 0 <= v < self.vertices:
+            if (np is not None and self.matrix.dtype != object
+                    and not _fits_int32(weight)):
+                # Иначе 0.5 записался бы как 0, а 2**31 - с переполнением
+                self.matrix = self.matrix.astype(object)
             self.matrix[u][v] = weight
             if not self.directed:
                 self.matrix[v][u] = weight
@@ -64,7 +96,7 @@ class AdjacencyMatrix:
             True если ребро существует, иначе False
         """
         if 0 <= u < self.vertices and 0 <= v < self.vertices:
-            return self.matrix[u][v] != 0
+            return bool(self.matrix[u][v] != 0)
         return False
     
     def get_neighbors(self, vertex):
@@ -76,6 +108,13 @@ class AdjacencyMatrix:
         Returns:
             Список пар (сосед, вес)
         """
+        if np is not None:
+            if not 0 <= vertex < self.vertices:
+                return []
+            row = self.matrix[vertex]
+            indices = np.flatnonzero(row)
+            return list(zip(indices.tolist(), row[indices].tolist()))
+        
         neighbors = []
         if 0 <= vertex < self.vertices:
             for v in range(self.vertices):
@@ -86,11 +125,16 @@ class AdjacencyMatrix:
     def print_matrix(self):
         """Вывод матрицы смежности."""
         print("Матрица смежности:")
-        for row in self.matrix:
+        rows = self.matrix.tolist() if np is not None else self.matrix
+        for row in rows:
             print(" ".join(str(val) for val in row))
     
     def get_edge_count(self):
         """Подсчет количества ребер."""
+        if np is not None:
+            count = int(np.count_nonzero(self.matrix))
+            return count if self.directed else count // 2
+        
         count = 0
         for i in range(self.vertices):
             for j in range(self.vertices):
@@ -101,6 +145,110 @@ class AdjacencyMatrix:
         return count
 
 
+class AdjacencyBitMatrix:
+    """
+    Матрица смежности невзвешенного графа в виде битовых строк.
+    
+    Строка вершины u - целое число, в котором бит v установлен, если есть
+    ребро u -> v. Операции со строками выполняются над машинными словами
+    внутри длинной арифметики Python (64 проверки смежности за одну).
+    
+    Свойства:
+    - Память: O(V²) бит
+    - Проверка наличия ребра: O(1)
+    - Получение соседей вершины: O(V / 64 + deg(V))
+    """
+    
+    def __init__(self, vertices=0, directed=False):
+        """
+        Инициализация битовой матрицы смежности.
+        
+        Args:
+            vertices: количество вершин (по умолчанию 0)
+            directed: ориентированный граф (True) или неориентированный (False)
+        """
+        self.directed = directed
+        self.vertices = vertices
+        self.rows = [0] * vertices
+    
+    def add_edge(self, u, v, weight=1):
+        """
+        Добавление ребра между вершинами u и v.
+        
+        Сложность: O(V / 64)
+        
+        Args:
+            u: начальная вершина
+            v: конечная вершина
+            weight: не используется (граф невзвешенный), оставлен для
+                    совместимости с AdjacencyMatrix
+        """
+        if 0 <= u < self.vertices and 0 <= v < self.vertices:
+            self.rows[u] |= 1 << v
+            if not self.directed:
+                self.rows[v] |= 1 << u
+    
+    def remove_edge(self, u, v):
+        """
+        Удаление ребра между вершинами u и v.
+        
+        Сложность: O(V / 64)
+        """
+        if 0 <= u < self.vertices and 0 <= v < self.vertices:
+            self.rows[u] &= ~(1 << v)
+            if not self.directed:
+                self.rows[v] &= ~(1 << u)
+    
+    def has_edge(self, u, v):
+        """
+        Проверка наличия ребра между вершинами u и v.
+        
+        Сложность: O(1)
+        
+        Returns:
+            True если ребро существует, иначе False
+        """
+        if 0 <= u < self.vertices and 0 <= v < self.vertices:
+            return (self.rows[u] >> v) & 1 == 1
+        return False
+    
+    def get_neighbor_mask(self, vertex):
+        """Битовая строка соседей вершины (бит v - ребро vertex -> v)."""
+        if 0 <= vertex < self.vertices:
+            return self.rows[vertex]
+        return 0
+    
+    def get_neighbors(self, vertex):
+        """
+        Получение всех соседей вершины.
+        
+        Сложность: O(V / 64 + deg(V))
+        
+        Returns:
+            Список пар (сосед, вес) с весом 1, по возрастанию номеров
+        """
+        neighbors = []
+        row = self.get_neighbor_mask(vertex)
+        while row:
+            lowest = row & -row  # Младший установленный бит
+            neighbors.append((lowest.bit_length() - 1, 1))
+            row ^= lowest
+        return neighbors
+    
+    def print_matrix(self):
+        """Вывод матрицы смежности."""
+        print("Матрица смежности (битовая):")
+        for row in self.rows:
+            print(" ".join(str((row >> v) & 1) for v in range(self.vertices)))
+    
+    def get_edge_count(self):
+        """Подсчет количества ребер."""
+        count = sum(bin(row).count("1") for row in self.rows)
+        if not self.directed:
+            count //= 2
+        return count
+
+
 class AdjacencyList:
     """
     Представление графа в виде списка смежности.
@@ -109,19 +257,36 @@ class AdjacencyList:
     - Память: O(V + E)
     - Проверка наличия ребра: O(deg(V))
     - Получение соседей вершины: O(1) в среднем
+    
+    Параллельно с adj_list (пары (сосед, вес)) ведутся списки neighbors
+    только с номерами соседей: невзвешенные обходы читают их напрямую,
+    без распаковки кортежей. Для невзвешенного графа (weighted=False)
+    пары не хранятся вовсе: adj_list и neighbors - одни и те же списки
+    номеров, а get_neighbors строит пары (сосед, 1) по запросу.
+    
+    После завершения построения граф можно «заморозить» методом freeze():
+    соседи всех вершин копируются в плотные массивы формата CSR
+    (indptr, indices, weights), по которым обходы идут без кортежей.
     """
     
-    def __init__(self, vertices=0, directed=False):
+    def __init__(self, vertices=0, directed=False, weighted=True):
         """
         Инициализация списка смежности.
         
         Args:
             vertices: количество вершин
             directed: ориентированный граф (True) или неориентированный (False)
+            weighted: хранить веса ребер; при False все веса равны 1
         """
         self.directed = directed
         self.vertices = vertices
-        self.adj_list = [[] for _ in range(vertices)]
+        self.weighted = weighted
+        self.neighbors = [[] for _ in range(vertices)]
+        self.adj_list = [[] for _ in range(vertices)] if weighted else self.neighbors
+        # Массивы CSR, заполняются методом freeze()
+        self.indptr = None
+        self.indices = None
+        self.weights = None
     
     def add_edge(self, u, v, weight=1):
         """
@@ -132,12 +297,17 @@ class AdjacencyList:
         Args:
             u: начальная вершина
             v: конечная вершина
-            weight: вес ребра (по умолчанию 1)
+            weight: вес ребра (по умолчанию 1; без weighted игнорируется)
         """
         if 0 <= u < self.vertices and 0 <= v < self.vertices:
-            self.adj_list[u].append((v, weight))
+            self._unfreeze()
+            self.neighbors[u].append(v)
+            if self.weighted:
+                self.adj_list[u].append((v, weight))
             if not self.directed:
-                self.adj_list[v].append((u, weight))
+                self.neighbors[v].append(u)
+                if self.weighted:
+                    self.adj_list[v].append((u, weight))
     
     def remove_edge(self, u, v):
         """
@@ -145,11 +315,21 @@ class AdjacencyList:
         
         Сложность: O(deg(u) + deg(v))
         """
+        self._unfreeze()
         if 0 <= u < self.vertices:
-            self.adj_list[u] = [edge for edge in self.adj_list[u] if edge[0] != v]
+            self._remove_neighbor(u, v)
         
         if not self.directed and 0 <= v < self.vertices:
-            self.adj_list[v] = [edge for edge in self.adj_list[v] if edge[0] != u]
+            self._remove_neighbor(v, u)
+    
+    def _remove_neighbor(self, vertex, neighbor):
+        """Удаление всех ребер vertex -> neighbor из списков вершины vertex."""
+        if self.weighted:
+            self.adj_list[vertex] = [edge for edge in self.adj_list[vertex] if edge[0] != neighbor]
+            self.neighbors[vertex] = [edge[0] for edge in self.adj_list[vertex]]
+        else:
+            # Списки изменяются на месте, чтобы adj_list и neighbors не разошлись
+            self.neighbors[vertex][:] = [n for n in self.neighbors[vertex] if n != neighbor]
     
     def has_edge(self, u, v):
         """
@@ -161,9 +341,7 @@ class AdjacencyList:
             True если ребро существует, иначе False
         """
         if 0 <= u < self.vertices:
-            for neighbor, _ in self.adj_list[u]:
-                if neighbor == v:
-                    return True
+            return v in self.neighbors[u]
         return False
     
     def get_neighbors(self, vertex):
@@ -172,13 +350,81 @@ class AdjacencyList:
         
         Сложность: O(1) для доступа к списку
         
+        Для взвешенного графа возвращается внутренний список без
+        копирования, поэтому изменять его нельзя.
+        
         Returns:
             Список пар (сосед, вес)
         """
         if 0 <= vertex < self.vertices:
-            return self.adj_list[vertex]
+            if self.weighted:
+                return self.adj_list[vertex]
+            return [(neighbor, 1) for neighbor in self.neighbors[vertex]]
+        return []
+    
+    def get_neighbors_unweighted(self, vertex):
+        """
+        Получение номеров соседей вершины без весов.
+        
+        Сложность: O(1), возвращается внутренний список (изменять его нельзя)
+        
+        Returns:
+            Список номеров соседей
+        """
+        if 0 <= vertex < self.vertices:
+            return self.neighbors[vertex]
         return []
     
+    def get_neighbors_csr(self, vertex):
+        """
+        Номера соседей вершины из CSR-представления.
+        
+        Возвращается memoryview-срез массива indices: он не копирует данные
+        и индексируется как обычная последовательность целых чисел. Если
+        граф еще не заморожен, CSR строится вызовом freeze().
+        
+        Сложность: O(1)
+        
+        Returns:
+            Срез indices[indptr[vertex]:indptr[vertex + 1]]
+        """
+        if not 0 <= vertex < self.vertices:
+            return memoryview(array('i'))
+        if not self.frozen:
+            self.freeze()
+        return memoryview(self.indices)[self.indptr[vertex]:self.indptr[vertex + 1]]
+    
+    def freeze(self):
+        """
+        Построение CSR-представления графа.
+        
+        Соседи вершины v - indices[indptr[v]:indptr[v + 1]], веса ребер -
+        в тех же позициях weights. Массивы array('i') непрерывны в памяти
+        и без копирования передаются в numpy через буфер. Любое изменение
+        графа сбрасывает CSR.
+        
+        Сложность: O(V + E)
+        
+        Returns:
+            self (для цепочек вызовов)
+        """
+        self.indptr = array('i', accumulate(map(len, self.neighbors), initial=0))
+        self.indices = array('i', [neighbor for group in self.neighbors for neighbor in group])
+        if self.weighted:
+            self.weights = [weight for edges in self.adj_list for _, weight in edges]
+        else:
+            self.weights = [1] * len(self.indices)
+        return self
+    
+    @property
+    def frozen(self):
+        """True, если CSR-представление построено и актуально."""
+        return self.indptr is not None
+    
+    def _unfreeze(self):
+        """Сброс CSR-представления при изменении графа."""
+        self.indptr = self.indices = self.weights = None
+    
     def print_list(self):
         """Вывод списка смежности."""
         print("Список смежности:")
@@ -5,9 +5,65 @@ graph_traversal.py
 2. Поиск в глубину (DFS) - рекурсивный и итеративный
 """
 
-from collections import deque
 from graph_representation import AdjacencyList
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    # numpy и numba необязательны: без них BFS выполняется в Python
+    njit = None
+
+
+if njit is not None:
+    # Явная сигнатура: компиляция выполняется при импорте, а с cache=True
+    # ее результат берется из __pycache__ при следующих запусках
+    @njit('UniTuple(int32[::1], 3)(int32[::1], int32[::1], int64, int64)', cache=True)
+    def _bfs_csr(indptr, indices, start_vertex, vertices):
+        """
+        BFS по массивам CSR.
+        
+        Очередь - заранее выделенный массив: каждая вершина попадает в нее
+        не более одного раза, поэтому он же хранит порядок обхода.
+        """
+        distances = np.full(vertices, -1, dtype=np.int32)
+        parents = np.full(vertices, -1, dtype=np.int32)
+        queue = np.empty(vertices, dtype=np.int32)
+        
+        queue[0] = start_vertex
+        distances[start_vertex] = 0
+        head = 0
+        tail = 1
+        
+        while head < tail:
+            current = queue[head]
+            head += 1
+            next_distance = distances[current] + 1
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                if distances[neighbor] == -1:  # Не посещена
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+        
+        return queue[:tail], distances, parents
+else:
+    _bfs_csr = None
+
+
+def _neighbor_ids(graph):
+    """
+    Функция vertex -> список номеров соседей (без весов).
+    
+    Для AdjacencyList это готовые списки graph.neighbors, для остальных
+    представлений номера извлекаются из пар (сосед, вес).
+    """
+    neighbor_lists = getattr(graph, 'neighbors', None)
+    if neighbor_lists is not None:
+        return neighbor_lists.__getitem__
+    return lambda vertex: [neighbor for neighbor, _ in graph.get_neighbors(vertex)]
+
 
 def bfs(graph, start_vertex):
     """
@@ -16,7 +72,7 @@ def bfs(graph, start_vertex):
     Сложность: O(V + E)
     
     Args:
-        graph: граф (объект AdjacencyList)
+        graph: граф (объект AdjacencyList; после freeze() используется CSR)
         start_vertex: начальная вершина
     
     Returns:
@@ -24,24 +80,114 @@ def bfs(graph, start_vertex):
         distances: расстояния от start_vertex до каждой вершины
         parents: родительские вершины для восстановления пути
     """
-    visited = []
-    distances = [-1] * graph.vertices  # -1 означает "не посещена"
-    parents = [-1] * graph.vertices
-    
-    queue = deque([start_vertex])
+    if _bfs_csr is not None and getattr(graph, 'frozen', False):
+        # Ядро собрано без проверки границ: недопустимая вершина (в том
+        # числе любая в пустом графе) должна отсекаться здесь
+        if not 0 <= start_vertex < graph.vertices:
+            raise IndexError(f"вершина {start_vertex} вне диапазона [0, {graph.vertices})")
+        # Замороженный граф и numba: компилированный обход, массивы CSR
+        # передаются в numpy без копирования
+        order, distances, parents = _bfs_csr(
+            np.frombuffer(graph.indptr, dtype=np.int32),
+            np.frombuffer(graph.indices, dtype=np.int32),
+            start_vertex, graph.vertices)
+        return order.tolist(), distances.tolist(), parents.tolist()
+    
+    vertices = graph.vertices
+    distances = [-1] * vertices  # -1 означает "не посещена"
+    parents = [-1] * vertices
+    
+    # Каждая вершина попадает в очередь не более одного раза, поэтому
+    # очередь - заранее выделенный список с индексами головы и хвоста.
+    # Его заполненная часть и есть порядок обхода
+    queue = [0] * vertices
+    queue[0] = start_vertex
+    head, tail = 0, 1
     distances[start_vertex] = 0
     
-    while queue:
-        current = queue.popleft()
-        visited.append(current)
+    if getattr(graph, 'frozen', False):
+        # Замороженный граф: соседи читаются срезами плотного массива CSR
+        indptr, indices = graph.indptr, graph.indices
+        while head < tail:
+            current = queue[head]
+            head += 1
+            # Расстояние до соседей одно для всей вершины
+            next_distance = distances[current] + 1
+            
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if distances[neighbor] == -1:  # Не посещена
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
         
-        for neighbor, _ in graph.get_neighbors(current):
+        return queue[:tail], distances, parents
+    
+    neighbor_ids = _neighbor_ids(graph)
+    while head < tail:
+        current = queue[head]
+        head += 1
+        # Расстояние до соседей одно для всей вершины
+        next_distance = distances[current] + 1
+        
+        for neighbor in neighbor_ids(current):
             if distances[neighbor] == -1:  # Не посещена
-                distances[neighbor] = distances[current] + 1
+                distances[neighbor] = next_distance
                 parents[neighbor] = current
-                queue.append(neighbor)
+                queue[tail] = neighbor
+                tail += 1
     
-    return visited, distances, parents
+    return queue[:tail], distances, parents
+
+
+def _set_bits(mask):
+    """Номера установленных битов маски по возрастанию."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def bfs_bitset(graph, start_vertex):
+    """
+    Поиск в ширину по уровням для AdjacencyBitMatrix.
+    
+    Фронт и множество посещенных вершин - битовые маски. Следующий фронт -
+    объединение строк матрицы для вершин текущего фронта без уже
+    посещенных: за одну операцию обрабатывается машинное слово вершин.
+    
+    Сложность: O(V * V / 64)
+    
+    Args:
+        graph: граф (объект AdjacencyBitMatrix)
+        start_vertex: начальная вершина
+    
+    Returns:
+        visited: посещенные вершины по уровням (внутри уровня - по возрастанию)
+        distances: расстояния от start_vertex до каждой вершины
+    """
+    rows = graph.rows
+    distances = [-1] * graph.vertices
+    distances[start_vertex] = 0
+    visited = [start_vertex]
+    
+    frontier = reached = 1 << start_vertex
+    level = 0
+    
+    while frontier:
+        next_frontier = 0
+        for vertex in _set_bits(frontier):
+            next_frontier |= rows[vertex]
+        next_frontier &= ~reached
+        reached |= next_frontier
+        
+        level += 1
+        for vertex in _set_bits(next_frontier):
+            distances[vertex] = level
+            visited.append(vertex)
+        frontier = next_frontier
+    
+    return visited, distances
 
 
 def bfs_shortest_path(graph, start, end):
@@ -92,18 +238,22 @@ def dfs_recursive(graph, start_vertex):
         visited: список посещенных вершин в порядке обхода
     """
     visited = []
+    # Флаги посещения: проверка за O(1) вместо поиска в списке visited
+    seen = bytearray(graph.vertices)
+    neighbor_ids = _neighbor_ids(graph)
     
     def dfs_util(vertex):
         visited.append(vertex)
-        for neighbor, _ in graph.get_neighbors(vertex):
-            if neighbor not in visited:
+        seen[vertex] = 1
+        for neighbor in neighbor_ids(vertex):
+            if not seen[neighbor]:
                 dfs_util(neighbor)
     
     dfs_util(start_vertex)
     return visited
 
 
-def dfs_iterative(graph, start_vertex):
+def dfs_iterative(graph, start_vertex, preserve_recursive_order=True):
     """
     Поиск в глубину (DFS) - итеративная реализация.
     
@@ -112,22 +262,36 @@ def dfs_iterative(graph, start_vertex):
     Args:
         graph: граф
         start_vertex: начальная вершина
+        preserve_recursive_order: посещать соседей в том же порядке, что и
+            рекурсивная версия. При False соседи кладутся в стек без
+            разворота (обход остается поиском в глубину, но соседи
+            посещаются от последнего к первому)
     
     Returns:
         visited: список посещенных вершин в порядке обхода
     """
     visited = []
+    # Флаги посещения: проверка за O(1) вместо поиска в списке visited
+    seen = bytearray(graph.vertices)
+    neighbor_ids = _neighbor_ids(graph)
     stack = [start_vertex]
+    # Методы списков связываются один раз, а не ищутся на каждой итерации
+    push, pop, extend = stack.append, stack.pop, stack.extend
+    visit = visited.append
     
     while stack:
-        vertex = stack.pop()
-        if vertex not in visited:
-            visited.append(vertex)
-            # Добавляем соседей в обратном порядке для соответствия рекурсивной версии
-            neighbors = graph.get_neighbors(vertex)
-            for neighbor, _ in reversed(neighbors):
-                if neighbor not in visited:
-                    stack.append(neighbor)
+        vertex = pop()
+        if not seen[vertex]:
+            visit(vertex)
+            seen[vertex] = 1
+            if preserve_recursive_order:
+                # Добавляем соседей в обратном порядке для соответствия рекурсивной версии
+                for neighbor in reversed(neighbor_ids(vertex)):
+                    if not seen[neighbor]:
+                        push(neighbor)
+            else:
+                extend(neighbor for neighbor in neighbor_ids(vertex)
+                       if not seen[neighbor])
     
     return visited
 
@@ -137,6 +301,7 @@ def dfs_with_timestamps(graph, start_vertex):
     DFS с метками времени (время входа и выхода).
     
     Сложность: O(V + E)
+    Реализация итеративная, поэтому не ограничена глубиной рекурсии.
     
     Args:
         graph: граф
@@ -150,21 +315,36 @@ def dfs_with_timestamps(graph, start_vertex):
     visited = []
     discovery_time = [-1] * graph.vertices
     finish_time = [-1] * graph.vertices
-    time = [0]  # Используем список для mutable времени
+    time = 0
+    # Флаги посещения: проверка за O(1) вместо поиска в списке visited
+    seen = bytearray(graph.vertices)
+    neighbor_ids = _neighbor_ids(graph)
+    
+    # Явный стек вместо рекурсии: элемент - вершина и итератор по ее
+    # соседям, сохраняющий место, где обход был прерван
+    visited.append(start_vertex)
+    seen[start_vertex] = 1
+    discovery_time[start_vertex] = time
+    time += 1
+    stack = [(start_vertex, iter(neighbor_ids(start_vertex)))]
     
-    def dfs_util(vertex):
-        visited.append(vertex)
-        discovery_time[vertex] = time[0]
-        time[0] += 1
-        
-        for neighbor, _ in graph.get_neighbors(vertex):
-            if neighbor not in visited:
-                dfs_util(neighbor)
-        
-        finish_time[vertex] = time[0]
-        time[0] += 1
+    while stack:
+        vertex, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if not seen[neighbor]:
+                # Вход в вершину: время обнаружения
+                visited.append(neighbor)
+                seen[neighbor] = 1
+                discovery_time[neighbor] = time
+                time += 1
+                stack.append((neighbor, iter(neighbor_ids(neighbor))))
+                break
+        else:
+            # Соседи исчерпаны: время завершения
+            finish_time[vertex] = time
+            time += 1
+            stack.pop()
     
-    dfs_util(start_vertex)
     return visited, discovery_time, finish_time
 
 
@@ -4,12 +4,70 @@ analysis.py
 Построение графиков производительности.
 """
 
+import gc
+import os
+import sys
 import time
+import timeit
 import random
 import string
-import matplotlib.pyplot as plt
 from prefix_function import compute_prefix_function
-from kmp_search import kmp_search, naive_search, compare_kmp_naive
+from kmp_search import KMPPattern, kmp_search, kmp_search_bytes, kmp_search_fast, naive_search, compare_kmp_naive
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него строки генерируются посимвольно
+    np = None
+
+# MPL_NO_SHOW=1 запрещает окна с графиками даже в терминале (см. _can_show_plots)
+SHOW_PLOTS = not os.environ.get('MPL_NO_SHOW')
+
+
+def _plot_dpi(default=100):
+    """PLOT_DPI из окружения; при ошибке в значении - default."""
+    try:
+        dpi = int(os.environ.get('PLOT_DPI', default))
+    except ValueError:
+        return default
+    return dpi if dpi > 0 else default
+
+
+PLOT_DPI = _plot_dpi()
+
+# Генератор с фиксированным зерном: замеры воспроизводимы между запусками
+rng = np.random.default_rng(0) if np is not None else random.Random(0)
+
+# Тексты для замеров по длине: один текст на размер для всех паттернов
+_text_cache = {}
+
+# Число серий замера (берется лучшая) и минимальная длительность серии
+TIMING_REPEATS = 5
+MIN_SERIES_NS = 10_000_000
+
+
+def measure_time(func, *args):
+    """
+    Время одного вызова func(*args) в секундах.
+    
+    Число вызовов в серии подбирается так, чтобы серия длилась не меньше
+    MIN_SERIES_NS, и из TIMING_REPEATS серий берется наименьшее время:
+    так отсекаются шум планировщика и разрешение часов. timeit на время
+    серии отключает сборщик мусора, а перед замером выполняется полная
+    сборка, чтобы мусор предыдущих замеров не влиял на этот.
+    """
+    gc.collect()
+    timer = timeit.Timer(lambda: func(*args), timer=time.perf_counter_ns)
+    
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < MIN_SERIES_NS:
+        # Оценка нужного числа вызовов по последней серии (с запасом)
+        number = max(number * 2, int(number * MIN_SERIES_NS * 1.2 / max(elapsed, 1)))
+        elapsed = timer.timeit(number)
+    
+    best = min([elapsed] + timer.repeat(repeat=TIMING_REPEATS - 1, number=number))
+    return best / number / 1e9
 
 
 def generate_random_string(length, alphabet_size=26):
@@ -23,8 +81,21 @@ def generate_random_string(length, alphabet_size=26):
     Returns:
         Случайная строка
     """
+    if np is not None:
+        # Коды букв генерируются одним массивом и декодируются как ASCII
+        codes = rng.integers(97, 97 + alphabet_size, size=length, dtype=np.uint8)
+        return codes.tobytes().decode('ascii')
+    
     alphabet = string.ascii_lowercase[:alphabet_size]
-    return ''.join(random.choice(alphabet) for _ in range(length))
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+
+def get_benchmark_text(length):
+    """Случайный текст заданной длины, общий для всех замеров с этой длиной."""
+    text = _text_cache.get(length)
+    if text is None:
+        text = _text_cache[length] = generate_random_string(length)
+    return text
 
 
 def generate_periodic_string(period, repetitions):
@@ -53,21 +124,20 @@ def measure_prefix_function_performance():
     sizes = [100, 500, 1000, 2000, 5000, 10000]
     times = []
     
-    print("Измерение производительности префикс-функции:")
-    print("Длина строки\tВремя (сек)")
-    print("-" * 40)
-    
     for size in sizes:
-        # Генерируем случайную строку
-        text = generate_random_string(size)
+        # Случайная строка (общая с остальными замерами этой длины)
+        text = get_benchmark_text(size)
         
-        # Замер времени
-        start = time.time()
-        compute_prefix_function(text)
-        elapsed = time.time() - start
+        # Замер времени (без кэша: при повторах серии иначе измерялся бы он)
+        elapsed = measure_time(compute_prefix_function, text, False)
         
         times.append(elapsed)
-        print(f"{size}\t\t{elapsed:.6f}")
+    
+    # Таблица выводится после всех замеров: вывод не перемежается с ними
+    rows = [f"{size}\t\t{elapsed:.6f}" for size, elapsed in zip(sizes, times)]
+    print("\n".join(["Измерение производительности префикс-функции:",
+                     "Длина строки\tВремя (сек)",
+                     "-" * 40] + rows))
     
     return sizes, times
 
@@ -84,42 +154,44 @@ def measure_kmp_performance():
     text_sizes = [1000, 5000, 10000, 20000, 50000]
     pattern_sizes = [10, 50, 100, 200]
     
-    print("\nИзмерение производительности KMP:")
-    print("Текст\tПаттерн\tВремя KMP\tВремя наивный\tУскорение")
-    print("-" * 60)
-    
     results = []
     
     for text_size in text_sizes:
-        text = generate_random_string(text_size)
+        text = get_benchmark_text(text_size)
         
         for pattern_size in pattern_sizes:
             if pattern_size > text_size:
                 continue
                 
             pattern = generate_random_string(pattern_size)
+            # Префикс-функция вычисляется до замера (ее время - в отдельной таблице)
+            kmp_pattern = KMPPattern(pattern)
             
-            # Замер времени KMP
-            start = time.time()
-            kmp_result = kmp_search(text, pattern)
-            kmp_time = time.time() - start
-            
-            # Замер времени наивного алгоритма
-            start = time.time()
-            naive_result = naive_search(text, pattern)
-            naive_time = time.time() - start
+            # Замер времени KMP и наивного алгоритма
+            kmp_time = measure_time(kmp_pattern.search, text)
+            naive_time = measure_time(naive_search, text, pattern)
             
             speedup = naive_time / kmp_time if kmp_time > 0 else float('inf')
             
+            # Результаты проверяются вне замеров; эталон - встроенный поиск
+            kmp_result = kmp_search(text, pattern)
+            naive_result = naive_search(text, pattern)
+            reference = kmp_search_fast(text, pattern)
+            
             results.append({
                 'text_size': text_size,
                 'pattern_size': pattern_size,
                 'kmp_time': kmp_time,
                 'naive_time': naive_time,
-                'speedup': speedup
+                'speedup': speedup,
+                'correct': kmp_result == naive_result == reference
             })
-            
-            print(f"{text_size}\t{pattern_size}\t{kmp_time:.6f}\t{naive_time:.6f}\t{speedup:.2f}x")
+    
+    rows = [f"{r['text_size']}\t{r['pattern_size']}\t{r['kmp_time']:.6f}\t"
+            f"{r['naive_time']:.6f}\t{r['speedup']:.2f}x" for r in results]
+    print("\n".join(["\nИзмерение производительности KMP:",
+                     "Текст\tПаттерн\tВремя KMP\tВремя наивный\tУскорение",
+                     "-" * 60] + rows))
     
     return results
 
@@ -131,27 +203,22 @@ def measure_worst_case_performance():
     """
     sizes = [100, 500, 1000, 2000, 5000]
     
-    print("\nИзмерение производительности в худшем случае:")
-    print("Размер\tВремя KMP\tВремя наивный\tУскорение")
-    print("-" * 50)
-    
     kmp_times = []
     naive_times = []
+    rows = []
     
     for size in sizes:
         text = "a" * size
         pattern = "a" * (size // 2)  # Паттерн половины длины текста
         
-        # KMP
-        start = time.time()
-        kmp_search(text, pattern)
-        kmp_time = time.time() - start
+        # KMP получает готовые bytes: кодирование не попадает в замер
+        text_bytes = b"a" * size
+        pattern_bytes = b"a" * (size // 2)
+        kmp_time = measure_time(kmp_search_bytes, text_bytes, pattern_bytes)
         
         # Наивный (только для небольших размеров)
         if size <= 2000:
-            start = time.time()
-            naive_search(text, pattern)
-            naive_time = time.time() - start
+            naive_time = measure_time(naive_search, text, pattern)
             naive_str = f"{naive_time:.6f}"
         else:
             naive_time = None
@@ -163,16 +230,44 @@ def measure_worst_case_performance():
         naive_times.append(naive_time if naive_time is not None else 0)
         
         speedup_str = f"{speedup:.2f}x" if speedup is not None else "N/A"
-        print(f"{size}\t{kmp_time:.6f}\t{naive_str}\t{speedup_str}")
+        rows.append(f"{size}\t{kmp_time:.6f}\t{naive_str}\t{speedup_str}")
+    
+    print("\n".join(["\nИзмерение производительности в худшем случае:",
+                     "Размер\tВремя KMP\tВремя наивный\tУскорение",
+                     "-" * 50] + rows))
     
     return sizes, kmp_times, naive_times
 
 
+def _pyplot():
+    """Импорт matplotlib.pyplot: нужен только при запуске с флагом --plot."""
+    import matplotlib
+    if not _can_show_plots():
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _can_show_plots():
+    """
+    Можно ли открывать окна с графиками.
+    
+    Окна показываются только при интерактивном запуске: вывод идет в
+    терминал и (в Linux) есть графический дисплей.
+    """
+    if not SHOW_PLOTS or not sys.stdout.isatty():
+        return False
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+
 def plot_performance_comparison():
     """
     Построение графиков сравнения производительности.
     """
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    plt = _pyplot()
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
     
     # Данные для графиков
     sizes_prefix = [100, 500, 1000, 2000, 5000, 10000]
@@ -235,9 +330,10 @@ def plot_performance_comparison():
     ax4.grid(True, alpha=0.3)
     ax4.legend()
     
-    plt.tight_layout()
-    plt.savefig('string_algorithms_performance.png', dpi=300)
-    plt.show()
+    fig.savefig('string_algorithms_performance.png', dpi=PLOT_DPI, bbox_inches='tight')
+    if _can_show_plots():
+        plt.show()
+    plt.close(fig)
 
 
 def practical_task():
@@ -267,8 +363,13 @@ def practical_task():
     print(f"Текст (сокращенный):\n{text[:200]}...")
     print(f"\nИщем паттерн: '{pattern}'")
     
-    # Поиск с помощью KMP
-    indices = kmp_search(text.lower(), pattern.lower())
+    # Поиск без учета регистра: текст и паттерн приводятся к нижнему
+    # регистру один раз и используются во всех поисках ниже
+    text_lc = text.lower()
+    pattern_lc = pattern.lower()
+    
+    # Поиск всех вхождений (встроенный поиск; KMP сравнивается ниже)
+    indices = kmp_search_fast(text_lc, pattern_lc)
     
     # Показываем контекст для каждого вхождения
     print(f"\nРезультаты поиска:")
@@ -284,7 +385,7 @@ def practical_task():
     
     # Сравнение с наивным алгоритмом
     print(f"\nСравнение с наивным алгоритмом:")
-    comparison = compare_kmp_naive(text.lower(), pattern.lower())
+    comparison = compare_kmp_naive(text_lc, pattern_lc)
     
     print(f"Время KMP: {comparison['kmp_time']:.8f} сек")
     print(f"Время наивного: {comparison['naive_time']:.8f} сек")
@@ -294,7 +395,15 @@ def practical_task():
     return indices
 
 
-def main():
+def main(argv=None):
+    """
+    Запуск замеров и практической задачи.
+    
+    Графики строятся только с флагом --plot: python analysis.py --plot
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    plot = '--plot' in argv
+    
     print("=" * 60)
     print("СРАВНИТЕЛЬНЫЙ АНАЛИЗ АЛГОРИТМОВ НА СТРОКАХ")
     print("=" * 60)
@@ -305,8 +414,9 @@ def main():
     worst_sizes, worst_kmp_times, worst_naive_times = measure_worst_case_performance()
     
     # Построение графиков
-    print("\nПостроение графиков производительности...")
-    plot_performance_comparison()
+    if plot:
+        print("\nПостроение графиков производительности...")
+        plot_performance_comparison()
     
     # Решение практической задачи
     print("\n")
@@ -315,11 +425,15 @@ def main():
     print("\n" + "=" * 60)
     print("АНАЛИЗ ЗАВЕРШЕН")
     print("=" * 60)
-    print("\nГрафики сохранены в файл: string_algorithms_performance.png")
+    if plot:
+        print("\nГрафики сохранены в файл: string_algorithms_performance.png")
+    else:
+        print("\nГрафики не строились (для построения запустите с флагом --plot)")
     print("\nВыводы:")
     print("1. Префикс-функция вычисляется за O(n)")
     print("2. KMP работает за O(n+m) вместо O(n*m) у наивного алгоритма")
-    print("3. В худшем случае ускорение KMP может достигать сотен раз")
+    print("3. В худшем случае KMP быстрее наивного поиска; с numpy наивный поиск")
+    print("   векторизован, и разрыв составляет единицы раз (см. таблицу худшего случая)")
     print("4. KMP особенно эффективен при поиске в больших текстах")
 
 
@@ -4,19 +4,238 @@ kmp_search.py
 Использует префикс-функцию для эффективного поиска.
 """
 
-from prefix_function import compute_prefix_function
+import io
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
+from prefix_function import compute_prefix_function, build_kmp_automaton, _prefix_function_nb
 
-def kmp_search(text, pattern):
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него наивный поиск выполняется в Python
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba необязателен: без него KMP выполняется в Python
+    njit = None
+
+# Паттерны до SHORT_PATTERN_FIND символов ищутся встроенным str.find,
+# до SHORT_PATTERN_MAX - специализированной версией KMP (kmp_search_short)
+SHORT_PATTERN_FIND = 4
+SHORT_PATTERN_MAX = 32
+
+# Минимальная длина текста для параллельного поиска: на меньших текстах
+# запуск процессов обходится дороже самого поиска
+PARALLEL_MIN_TEXT = 1 << 20
+
+# Наибольший размер (в байтах) матрицы сравнений окон в наивном поиске;
+# для больших n * m кандидаты отбираются по первому символу
+NAIVE_WINDOW_LIMIT = 1 << 24
+
+
+def _as_bytes_array(string):
+    """ASCII-строка как массив uint8 без копирования данных."""
+    return np.frombuffer(string.encode('ascii'), dtype=np.uint8)
+
+
+def _encoded(sequence):
+    """
+    Последовательность в виде bytes, если по ней можно искать побайтово.
+    
+    ASCII-строка кодируется (индексы байтов совпадают с индексами
+    символов), bytes и bytearray возвращаются как bytes; для прочих
+    строк и последовательностей возвращается None.
+    """
+    if isinstance(sequence, str):
+        return sequence.encode('ascii') if sequence.isascii() else None
+    if isinstance(sequence, (bytes, bytearray)):
+        return bytes(sequence)
+    return None
+
+
+if njit is not None and np is not None and _prefix_function_nb is not None:
+    @njit(cache=True, boundscheck=False)
+    def _kmp_search_nb(text, pattern, pi):
+        """
+        Основной цикл KMP по массивам байтов (uint8).
+        
+        Вхождений не больше n, поэтому результат пишется в заранее
+        выделенный массив int32 и обрезается по счетчику.
+        """
+        n = text.shape[0]
+        m = pattern.shape[0]
+        occurrences = np.empty(n, dtype=np.int32)
+        count = 0
+        j = 0
+        
+        for i in range(n):
+            while j > 0 and text[i] != pattern[j]:
+                j = pi[j - 1]
+            if text[i] == pattern[j]:
+                j += 1
+            if j == m:
+                occurrences[count] = i - m + 1
+                count += 1
+                j = pi[j - 1]
+        
+        return occurrences[:count]
+    
+    @njit(cache=True, boundscheck=False)
+    def _kmp_dfa_nb(text, delta, m):
+        """Проход автомата KMP по массиву байтов: один переход на символ."""
+        n = text.shape[0]
+        occurrences = np.empty(n, dtype=np.int64)
+        count = 0
+        j = 0
+        
+        for i in range(n):
+            j = delta[j, text[i]]
+            if j == m:
+                occurrences[count] = i - m + 1
+                count += 1
+        
+        return occurrences[:count]
+    
+    @njit(cache=True, boundscheck=False)
+    def _naive_search_small_nb(text, pattern_word, m):
+        """
+        Наивный поиск паттерна длины m <= 8 (SWAR).
+        
+        Последние 8 байтов текста хранятся в одном 64-битном слове
+        (сдвиговый регистр, новый байт - в старший разряд), и окно из m
+        байтов сравнивается с упакованным паттерном одной операцией.
+        """
+        n = text.shape[0]
+        occurrences = np.empty(n, dtype=np.int64)
+        count = 0
+        shift = np.uint64(64 - 8 * m)
+        window = np.uint64(0)
+        
+        for i in range(n):
+            window = (window >> np.uint64(8)) | (np.uint64(text[i]) << np.uint64(56))
+            if i >= m - 1 and (window >> shift) == pattern_word:
+                occurrences[count] = i - m + 1
+                count += 1
+        
+        return occurrences[:count]
+    
+    # Первый вызов компилирует ядра (или читает их из кэша на диске),
+    # чтобы время компиляции не попадало в замеры
+    _kmp_search_nb(_as_bytes_array('a'), _as_bytes_array('a'),
+                   _prefix_function_nb(_as_bytes_array('a')))
+    _kmp_dfa_nb(_as_bytes_array('a'), build_kmp_automaton('a'), 1)
+    _naive_search_small_nb(_as_bytes_array('a'), np.uint64(ord('a')), 1)
+else:
+    _kmp_search_nb = None
+    _kmp_dfa_nb = None
+    _naive_search_small_nb = None
+
+
+def _as_result(occurrences, as_array):
+    """Индексы вхождений как список или (по запросу и при наличии numpy) массив int32."""
+    if as_array and np is not None:
+        return np.asarray(occurrences, dtype=np.int32)
+    return occurrences
+
+
+class KMPPattern:
+    """
+    Паттерн, подготовленный для поиска KMP в нескольких текстах.
+    
+    Префикс-функция вычисляется один раз в конструкторе (O(m)), после чего
+    каждый вызов search() стоит O(n). Удобно, когда один паттерн ищется во
+    многих текстах.
+    
+    Пример:
+        kmp = KMPPattern("ababd")
+        kmp.search("ababcabcabababd")  # [10]
+    """
+    
+    def __init__(self, pattern):
+        """
+        Подготовка паттерна.
+        
+        Args:
+            pattern: подстрока, которую будем искать (str, bytes или
+                любая последовательность сравнимых элементов)
+        """
+        self.pattern = pattern
+        self._is_str = isinstance(pattern, str)
+        # ASCII-строка и bytes хранятся и в виде bytes: поиск по ним быстрее
+        self.pattern_bytes = _encoded(pattern)
+        self._pattern_array = None
+        self._pi_array = None
+        
+        if _kmp_search_nb is not None and self.pattern_bytes:
+            # Префикс-функция в виде массива для ядра numba
+            self._pattern_array = np.frombuffer(self.pattern_bytes, dtype=np.uint8)
+            self._pi_array = _prefix_function_nb(self._pattern_array)
+            self.pi = self._pi_array.tolist()
+        elif self.pattern_bytes is not None:
+            self.pi = compute_prefix_function(self.pattern_bytes)
+        else:
+            self.pi = compute_prefix_function(pattern)
+    
+    def __len__(self):
+        return len(self.pattern)
+    
+    def search(self, text, as_array=False):
+        """
+        Поиск всех вхождений паттерна в text.
+        
+        Args:
+            text: строка, в которой ищем (того же типа, что и паттерн)
+            as_array: вернуть массив numpy int32 вместо списка
+        
+        Returns:
+            Список (или массив) начальных индексов всех вхождений
+        """
+        n, m = len(text), len(self.pattern)
+        if m == 0:
+            return _as_result(list(range(n + 1)), as_array)
+        if m > n:
+            return _as_result([], as_array)
+        
+        text_bytes = None
+        if self.pattern_bytes is not None and isinstance(text, str) == self._is_str:
+            text_bytes = _encoded(text)
+        if text_bytes is not None:
+            # ASCII и bytes: поиск идет по bytes - ядром numba или циклом
+            # Python, в котором сравниваются небольшие целые вместо
+            # односимвольных строк
+            if self._pi_array is not None:
+                occurrences = _kmp_search_nb(np.frombuffer(text_bytes, dtype=np.uint8),
+                                             self._pattern_array, self._pi_array)
+                return occurrences if as_array else occurrences.tolist()
+            return _as_result(_kmp_scan(text_bytes, self.pattern_bytes, self.pi), as_array)
+        
+        # Прочие символы Unicode и последовательности: поиск по самому тексту
+        return _as_result(_kmp_scan(text, self.pattern, self.pi), as_array)
+
+
+def kmp_search(text, pattern, as_array=False):
     """
     Алгоритм Кнута-Морриса-Пратта для поиска всех вхождений подстроки.
     
+    Для строк реализация выбирается по длине паттерна: до
+    SHORT_PATTERN_FIND символов - встроенный str.find (kmp_search_fast),
+    до SHORT_PATTERN_MAX без ядра numba - kmp_search_short, иначе -
+    KMPPattern. Для поиска одного паттерна во многих текстах удобнее
+    KMPPattern: префикс-функция тогда вычисляется один раз.
+    
     Args:
         text: строка, в которой ищем
         pattern: подстрока, которую ищем
+        as_array: вернуть массив numpy int32 вместо списка (4 байта на
+            индекс вместо объекта int; без numpy игнорируется)
     
     Returns:
-        Список начальных индексов всех вхождений pattern в text
+        Список (или массив) начальных индексов всех вхождений pattern в text
     
     Сложность:
         Время: O(n + m), где n = len(text), m = len(pattern)
@@ -27,26 +246,95 @@ def kmp_search(text, pattern):
         pattern = "ababd"
         Результат: [10] (индекс начала вхождения)
     """
-    if not pattern:
-        return list(range(len(text) + 1))
+    m = len(pattern)
+    if m > len(text):
+        return _as_result([], as_array)
+    
+    if 0 < m and isinstance(text, str) and isinstance(pattern, str):
+        if m <= SHORT_PATTERN_FIND:
+            # Очень короткий паттерн: встроенный поиск быстрее любого KMP
+            return _as_result(kmp_search_fast(text, pattern), as_array)
+        
+        compiled = _kmp_search_nb is not None and text.isascii() and pattern.isascii()
+        if m <= SHORT_PATTERN_MAX and not compiled:
+            return _as_result(kmp_search_short(text, pattern), as_array)
     
-    n, m = len(text), len(pattern)
-    if m > n:
-        return []
+    # bytes передаются в KMPPattern как есть, прочие последовательности
+    # обрабатываются общим циклом
+    return KMPPattern(pattern).search(text, as_array)
+
+
+def kmp_search_short(text, pattern):
+    """
+    KMP для коротких паттернов (до SHORT_PATTERN_MAX символов).
+    
+    Префикс-функция вычисляется прямо перед поиском в компактный
+    array('i'), без отдельного вызова compute_prefix_function и
+    его кэша: для коротких паттернов накладные расходы вызова
+    сравнимы с самим вычислением.
+    
+    Args:
+        text: строка, в которой ищем
+        pattern: подстрока, которую ищем (1 <= m <= n)
+    
+    Returns:
+        Список начальных индексов всех вхождений
+    """
+    if (isinstance(text, str) and isinstance(pattern, str)
+            and text.isascii() and pattern.isascii()):
+        # Сравнение небольших целых дешевле сравнения односимвольных строк
+        text = text.encode('ascii')
+        pattern = pattern.encode('ascii')
+    
+    m = len(pattern)
+    pi = array('i', [0]) * m
+    
+    j = 0
+    for i in range(1, m):
+        c = pattern[i]
+        while j > 0 and c != pattern[j]:
+            j = pi[j - 1]
+        if c == pattern[j]:
+            j += 1
+        pi[i] = j
     
-    # Вычисляем префикс-функцию для паттерна
-    pi = compute_prefix_function(pattern)
+    occurrences = []
+    j = 0
+    for i, c in enumerate(text):
+        while j > 0 and c != pattern[j]:
+            j = pi[j - 1]
+        if c == pattern[j]:
+            j += 1
+        if j == m:
+            occurrences.append(i - m + 1)
+            j = pi[j - 1]
+    
+    return occurrences
+
+
+def _kmp_search_compiled(text_bytes, pattern_bytes):
+    """KMP ядром numba по bytes (m <= n); результат - массив int32."""
+    pattern_array = np.frombuffer(pattern_bytes, dtype=np.uint8)
+    pi = _prefix_function_nb(pattern_array)
+    return _kmp_search_nb(np.frombuffer(text_bytes, dtype=np.uint8), pattern_array, pi)
+
+
+def _kmp_scan(text, pattern, pi):
+    """Основной цикл KMP в Python (для str или bytes, 0 < m <= n)."""
+    n, m = len(text), len(pattern)
     
     occurrences = []
     j = 0  # Текущая позиция в паттерне
     
     for i in range(n):  # i - текущая позиция в тексте
+        c = text[i]  # Символ читается из текста один раз за итерацию
+        
         # Пока есть несовпадение, сдвигаем паттерн с использованием префикс-функции
-        while j > 0 and text[i] != pattern[j]:
+        while j > 0 and c != pattern[j]:
             j = pi[j - 1]
         
         # Если символы совпали, продвигаемся по паттерну
-        if text[i] == pattern[j]:
+        if c == pattern[j]:
             j += 1
         
         # Если дошли до конца паттерна - нашли вхождение
@@ -57,6 +345,137 @@ def kmp_search(text, pattern):
     return occurrences
 
 
+def kmp_search_bytes(text, pattern):
+    """
+    Алгоритм KMP для текста и паттерна в виде bytes.
+    
+    Данные уже закодированы, поэтому encode() не выполняется: с numba
+    буферы передаются в ядро без копирования, без numba работает тот же
+    цикл, что и в kmp_search (элементы bytes - целые числа).
+    
+    Args:
+        text: bytes, в которых ищем
+        pattern: искомая последовательность байтов
+    
+    Returns:
+        Список начальных индексов всех вхождений
+    """
+    if not pattern:
+        return list(range(len(text) + 1))
+    
+    if len(pattern) > len(text):
+        return []
+    
+    if _kmp_search_nb is not None:
+        return _kmp_search_compiled(text, pattern).tolist()
+    
+    return _kmp_scan(text, pattern, compute_prefix_function(pattern))
+
+
+def kmp_search_dfa(text_bytes, delta, m):
+    """
+    Поиск KMP по готовому автомату (см. build_kmp_automaton).
+    
+    Вместо цикла откатов по префикс-функции на каждый байт текста
+    выполняется ровно один переход по таблице.
+    
+    Args:
+        text_bytes: текст в виде bytes/bytearray или массива uint8
+        delta: таблица переходов автомата для паттерна
+        m: длина паттерна
+    
+    Returns:
+        Список начальных индексов всех вхождений
+    
+    Сложность:
+        Время: O(n) (плюс O(m * sigma) на построение автомата)
+    """
+    n = len(text_bytes)
+    if m == 0:
+        return list(range(n + 1))
+    
+    if _kmp_dfa_nb is not None and isinstance(delta, np.ndarray):
+        text_array = np.frombuffer(text_bytes, dtype=np.uint8)
+        return _kmp_dfa_nb(text_array, delta, m).tolist()
+    
+    occurrences = []
+    j = 0
+    for i, code in enumerate(bytes(text_bytes)):
+        j = delta[j][code]
+        if j == m:
+            occurrences.append(i - m + 1)
+    
+    return occurrences
+
+
+def kmp_search_fast(text, pattern):
+    """
+    Поиск всех вхождений подстроки встроенным методом find.
+    
+    str.find (и bytes.find) реализован на C: одиночный символ ищется через
+    memchr, длинные паттерны - алгоритмом two-way, который, как и KMP,
+    гарантирует линейное время в худшем случае. kmp_search использует
+    его для самых коротких паттернов, в остальных случаях это эталон
+    для проверки результатов KMP и наивного алгоритма.
+    
+    Args:
+        text: строка, в которой ищем
+        pattern: подстрока, которую ищем
+    
+    Returns:
+        Список начальных индексов всех вхождений (в том числе
+        перекрывающихся) pattern в text
+    """
+    occurrences = []
+    i = text.find(pattern)
+    while i != -1:
+        occurrences.append(i)
+        i = text.find(pattern, i + 1)
+    return occurrences
+
+
+def _search_chunk(task):
+    """Поиск KMP в одном куске текста (выполняется в процессе-обработчике)."""
+    chunk, kmp_pattern, offset, chunk_size = task
+    # Вхождения, начинающиеся в перекрытии, принадлежат следующему куску
+    return [offset + j for j in kmp_pattern.search(chunk) if j < chunk_size]
+
+
+def kmp_search_parallel(text, pattern, workers=None):
+    """
+    Параллельный поиск KMP по кускам текста.
+    
+    Текст делится на куски с перекрытием m - 1 символов, чтобы вхождения
+    на границах не терялись; куски обрабатываются в ProcessPoolExecutor,
+    индексы сдвигаются на начало куска. Короткие тексты (меньше
+    PARALLEL_MIN_TEXT) ищутся в текущем процессе.
+    
+    Args:
+        text: строка, в которой ищем
+        pattern: подстрока, которую ищем
+        workers: число процессов (по умолчанию - число ядер)
+    
+    Returns:
+        Список начальных индексов всех вхождений (как у kmp_search)
+    """
+    n, m = len(text), len(pattern)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or m == 0 or m > n or n < PARALLEL_MIN_TEXT:
+        return kmp_search(text, pattern)
+    
+    chunk_size = max(m, -(-n // workers))
+    # Префикс-функция вычисляется один раз и передается всем обработчикам
+    kmp_pattern = KMPPattern(pattern)
+    tasks = [(text[i:i + chunk_size + m - 1], kmp_pattern, i, chunk_size)
+             for i in range(0, n, chunk_size)]
+    
+    occurrences = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_occurrences in executor.map(_search_chunk, tasks):
+            occurrences.extend(chunk_occurrences)
+    return occurrences
+
+
 def kmp_search_with_highlight(text, pattern):
     """
     Поиск с визуализацией - подсветка найденных вхождений.
@@ -75,26 +494,32 @@ def kmp_search_with_highlight(text, pattern):
     if not occurrences:
         return occurrences, text
     
-    highlighted_parts = []
+    # kmp_search возвращает вхождения по возрастанию, сортировка не нужна
+    assert all(a < b for a, b in zip(occurrences, occurrences[1:]))
+    
+    buffer = io.StringIO()
+    write = buffer.write
     prev_end = 0
+    m = len(pattern)
     
-    for start in sorted(occurrences):
-        end = start + len(pattern)
+    for start in occurrences:
+        end = start + m
         
         # Добавляем часть до вхождения
         if start > prev_end:
-            highlighted_parts.append(text[prev_end:start])
+            write(text[prev_end:start])
         
         # Добавляем подсвеченное вхождение
-        highlighted_parts.append(f"[{text[start:end]}]")
+        write("[")
+        write(text[start:end])
+        write("]")
         prev_end = end
     
     # Добавляем остаток текста
     if prev_end < len(text):
-        highlighted_parts.append(text[prev_end:])
+        write(text[prev_end:])
     
-    highlighted_text = "".join(highlighted_parts)
-    return occurrences, highlighted_text
+    return occurrences, buffer.getvalue()
 
 
 def naive_search(text, pattern):
@@ -116,6 +541,10 @@ def naive_search(text, pattern):
         return list(range(len(text) + 1))
     
     n, m = len(text), len(pattern)
+    if (np is not None and m <= n and isinstance(text, str) and isinstance(pattern, str)
+            and text.isascii() and pattern.isascii()):
+        return _naive_search_numpy(text, pattern)
+    
     occurrences = []
     
     for i in range(n - m + 1):
@@ -130,10 +559,44 @@ def naive_search(text, pattern):
     return occurrences
 
 
+def _naive_search_numpy(text, pattern):
+    """
+    Наивный поиск средствами numpy (для ASCII-строк, m <= n).
+    
+    Паттерны длиной до 8 символов при наличии numba сравниваются
+    словами по 8 байтов (_naive_search_small_nb).
+    
+    Все окна длины m сравниваются с паттерном одной векторной операцией
+    над представлением sliding_window_view (без копирования текста). Если
+    матрица сравнений слишком велика, сначала отбираются позиции с
+    совпадающим первым символом, а затем они проверяются целиком.
+    """
+    n, m = len(text), len(pattern)
+    text_bytes = _as_bytes_array(text)
+    pattern_bytes = _as_bytes_array(pattern)
+    
+    if m <= 8 and _naive_search_small_nb is not None:
+        # Короткий паттерн целиком помещается в 64-битное слово
+        pattern_word = np.uint64(int.from_bytes(pattern_bytes.tobytes(), 'little'))
+        return _naive_search_small_nb(text_bytes, pattern_word, m).tolist()
+    
+    if (n - m + 1) * m <= NAIVE_WINDOW_LIMIT:
+        windows = np.lib.stride_tricks.sliding_window_view(text_bytes, m)
+        matches = (windows == pattern_bytes).all(axis=1)
+        return np.flatnonzero(matches).tolist()
+    
+    candidates = np.flatnonzero(text_bytes[:n - m + 1] == pattern_bytes[0])
+    return [i for i in candidates.tolist() if text.startswith(pattern, i)]
+
+
 def compare_kmp_naive(text, pattern):
     """
     Сравнение результатов KMP и наивного алгоритма.
     
+    Замеряется сам KMP (KMPPattern, включая вычисление префикс-функции),
+    а не kmp_search, который для коротких паттернов вызывает str.find;
+    результаты сверяются со встроенным поиском.
+    
     Args:
         text: текст для поиска
         pattern: паттерн для поиска
@@ -141,20 +604,18 @@ def compare_kmp_naive(text, pattern):
     Returns:
         Словарь с результатами сравнения
     """
-    import time
-    
     # Замер времени для KMP
-    start = time.time()
-    kmp_result = kmp_search(text, pattern)
-    kmp_time = time.time() - start
+    start = time.perf_counter_ns()
+    kmp_result = KMPPattern(pattern).search(text)
+    kmp_time = (time.perf_counter_ns() - start) / 1e9
     
     # Замер времени для наивного алгоритма
-    start = time.time()
+    start = time.perf_counter_ns()
     naive_result = naive_search(text, pattern)
-    naive_time = time.time() - start
+    naive_time = (time.perf_counter_ns() - start) / 1e9
     
-    # Проверка корректности
-    correct = kmp_result == naive_result
+    # Проверка корректности (эталон - встроенный поиск)
+    correct = kmp_result == naive_result == kmp_search_fast(text, pattern)
     
     return {
         'kmp_result': kmp_result,
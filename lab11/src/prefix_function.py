@@ -4,15 +4,57 @@ prefix_function.py
 Префикс-функция используется в алгоритме Кнута-Морриса-Пратта (KMP).
 """
 
-def compute_prefix_function(pattern):
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy необязателен: без него таблица автомата - список списков
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba необязателен: без него префикс-функция считается в Python
+    njit = None
+
+
+if njit is not None and np is not None:
+    @njit(cache=True, boundscheck=False)
+    def _prefix_function_nb(pattern):
+        """Префикс-функция для массива байтов pattern (uint8)."""
+        m = pattern.shape[0]
+        pi = np.zeros(m, dtype=np.int64)
+        
+        for i in range(1, m):
+            j = pi[i - 1]
+            while j > 0 and pattern[i] != pattern[j]:
+                j = pi[j - 1]
+            if pattern[i] == pattern[j]:
+                j += 1
+            pi[i] = j
+        
+        return pi
+else:
+    _prefix_function_nb = None
+
+
+def compute_prefix_function(pattern, use_cache=True):
     """
     Вычисление префикс-функции для строки pattern.
     
     Префикс-функция π[i] - длина наибольшего собственного префикса подстроки pattern[0..i],
     который является суффиксом этой же подстроки.
     
+    Результаты для строк и bytes запоминаются (lru_cache на 256 паттернов),
+    поэтому повторный поиск того же паттерна не пересчитывает π; вызывающий
+    получает собственную копию списка. Кэш очищается вызовом
+    compute_prefix_function.cache_clear().
+    
     Args:
         pattern: строка, для которой вычисляется префикс-функция
+        use_cache: использовать кэш (False - всегда вычислять заново,
+            например для замеров времени)
     
     Returns:
         Список значений префикс-функции
@@ -26,6 +68,14 @@ def compute_prefix_function(pattern):
         prefix = compute_prefix_function(pattern)
         Результат: [0, 0, 1, 2, 3, 4, 0, 1]
     """
+    if use_cache and isinstance(pattern, (str, bytes)):
+        return list(_prefix_function_cached(pattern))
+    
+    if isinstance(pattern, str) and pattern.isascii():
+        # Элементы bytes - небольшие целые: их сравнение дешевле, чем
+        # создание и сравнение односимвольных строк
+        pattern = pattern.encode('ascii')
+    
     m = len(pattern)
     if m == 0:
         return []
@@ -34,14 +84,15 @@ def compute_prefix_function(pattern):
     
     # Вычисляем префикс-функцию для каждого префикса
     for i in range(1, m):
+        c = pattern[i]  # Текущий символ читается один раз
         j = pi[i - 1]  # Длина предыдущего префикса-суффикса
         
         # Пытаемся расширить предыдущий префикс-суффикс
-        while j > 0 and pattern[i] != pattern[j]:
+        while j > 0 and c != pattern[j]:
             j = pi[j - 1]  # Откатываемся к более короткому префиксу
         
         # Если символы совпадают, увеличиваем длину префикса-суффикса
-        if pattern[i] == pattern[j]:
+        if c == pattern[j]:
             j += 1
         
         pi[i] = j
@@ -49,6 +100,58 @@ def compute_prefix_function(pattern):
     return pi
 
 
+@lru_cache(maxsize=256)
+def _prefix_function_cached(pattern):
+    """Кэшируемая префикс-функция (кортеж, чтобы кэш нельзя было изменить)."""
+    return tuple(compute_prefix_function(pattern, use_cache=False))
+
+
+compute_prefix_function.cache_clear = _prefix_function_cached.cache_clear
+compute_prefix_function.cache_info = _prefix_function_cached.cache_info
+
+
+def build_kmp_automaton(pattern, sigma=256):
+    """
+    Построение автомата KMP: полной таблицы переходов delta[j][c].
+    
+    Состояние j - длина совпавшего префикса паттерна. Из состояния j по
+    символу c автомат переходит в j + 1, если c == pattern[j], иначе - туда
+    же, куда и из состояния π[j-1] (из 0 - в 0). Строка m (полное
+    совпадение) совпадает со строкой π[m-1], поэтому после найденного
+    вхождения поиск продолжается без отдельного отката.
+    
+    Args:
+        pattern: строка (символы с кодами < sigma) или bytes
+        sigma: размер алфавита
+    
+    Returns:
+        Таблица (m + 1) x sigma: массив numpy int32 или список списков
+    
+    Сложность:
+        Время и память: O(m * sigma)
+    """
+    codes = list(pattern) if isinstance(pattern, (bytes, bytearray)) else [ord(c) for c in pattern]
+    if any(code >= sigma for code in codes):
+        raise ValueError(f"символ паттерна вне алфавита размера {sigma}")
+    
+    m = len(codes)
+    pi = compute_prefix_function(codes)
+    
+    if np is not None:
+        delta = np.zeros((m + 1, sigma), dtype=np.int32)
+    else:
+        delta = [[0] * sigma for _ in range(m + 1)]
+    
+    for j in range(m + 1):
+        # Переходы по несовпадению - из состояния отката
+        if j > 0:
+            delta[j][:] = delta[pi[j - 1]]
+        if j < m:
+            delta[j][codes[j]] = j + 1
+    
+    return delta
+
+
 def visualize_prefix_function(pattern, pi):
     """
     Визуализация префикс-функции для наглядности.